@@ -42,6 +42,11 @@ class Build:
 class BaseAgent(ABC):
     """Abstract base class for external-facing agents."""
 
+    @property
+    def name(self) -> str:
+        """Display name used in series results; defaults to the class name."""
+        return type(self).__name__
+
     @abstractmethod
     def choose_build(
         self,
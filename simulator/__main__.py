@@ -16,12 +16,15 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
-import math
+import multiprocessing
 import sys
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from simulator.animals import (
     ANIMAL_ABILITIES,
     ANIMAL_PASSIVE,
@@ -35,13 +38,17 @@ from simulator.engine import CombatEngine, CombatResult
 from simulator.grid import Grid
 
 
+@functools.lru_cache(maxsize=1)
 def _load_config_hash() -> str:
-    """Load config.json and return first 8 chars of SHA-256."""
+    """Load config.json and return first 8 chars of SHA-256.
+
+    Cached: the config is immutable for the lifetime of a run, so the
+    file is read and hashed at most once no matter how many modes ask.
+    """
     config_path = Path(__file__).parent / "config.json"
     if not config_path.exists():
         return "unknown"
-    data = config_path.read_bytes()
-    return hashlib.sha256(data).hexdigest()[:8]
+    return hashlib.sha256(config_path.read_bytes()).hexdigest()[:8]
 
 
 def _parse_build(build_str: str) -> tuple[Animal, int, int, int, int]:
@@ -77,20 +84,26 @@ def _parse_build(build_str: str) -> tuple[Animal, int, int, int, int]:
     return animal, hp, atk, spd, wil
 
 
+# Stats are small ints, so dodge/resist collapse to lookup tables built
+# from the canonical formulas (identical floats, no per-call FP math).
+_DODGE_TABLE = tuple(
+    max(0.0, min(0.30, 0.025 * (spd - 1))) for spd in range(21)
+)
+_RESIST_TABLE = tuple(min(0.60, wil * 0.033) for wil in range(21))
+
+
 def _compute_derived(hp: int, atk: int, spd: int, wil: int) -> dict[str, Any]:
     """Compute derived stats from raw stat allocation."""
-    max_hp = 50 + 10 * hp
-    base_dmg = math.floor(2 + 0.85 * atk)
-    dodge = max(0.0, min(0.30, 0.025 * (spd - 1)))
-    resist = min(0.60, wil * 0.033)
+    # base_dmg = floor(2 + 0.85 * atk), exact in integer form (0.85 = 17/20)
     return {
-        "max_hp": max_hp,
-        "base_dmg": base_dmg,
-        "dodge": dodge,
-        "resist": resist,
+        "max_hp": 50 + 10 * hp,
+        "base_dmg": (40 + 17 * atk) // 20,
+        "dodge": _DODGE_TABLE[spd],
+        "resist": _RESIST_TABLE[wil],
     }
 
 
+@functools.lru_cache(maxsize=None)
 def _compute_size(hp: int, atk: int) -> Size:
     """Compute creature size from HP+ATK sum."""
     total = hp + atk
@@ -104,20 +117,36 @@ def _compute_size(hp: int, atk: int) -> Size:
         return Size(3, 2)
 
 
-def _create_creature(
+# Winner string -> counter slot (a, b, draw); one dict hash beats two
+# string compares per game in the tally loop.
+_WINNER_IDX = {"a": 0, "b": 1}
+
+# Fallback passive for animals missing from ANIMAL_PASSIVE; dict.get
+# evaluates its default eagerly, so build the list once, not per creature.
+_DEFAULT_PASSIVE = next(iter(ANIMAL_PASSIVE.values()))
+
+# Shared: generate_starting_position is deterministic from (side, size,
+# seed) and never touches placed-creature state, so one Grid serves all
+# creature constructions.
+_GRID = Grid()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_template(
     animal: Animal, hp: int, atk: int, spd: int, wil: int,
-    side: str, match_seed: int,
-) -> Creature:
-    """Create a Creature from raw build parameters."""
+) -> tuple:
+    """Precompute the seed-independent pieces of a creature build.
+
+    Everything here depends only on the build, so it is memoized on the
+    build signature; batch modes see the same few builds thousands of
+    times. All cached pieces are immutable or treated as read-only.
+    """
     stats = StatBlock(hp=hp, atk=atk, spd=spd, wil=wil)
     derived = _compute_derived(hp, atk, spd, wil)
     size = _compute_size(hp, atk)
-    passive = ANIMAL_PASSIVE.get(animal, list(ANIMAL_PASSIVE.values())[0])
+    passive = ANIMAL_PASSIVE.get(animal, _DEFAULT_PASSIVE)
     abilities = ANIMAL_ABILITIES.get(animal, ())
 
-    grid = Grid()
-    position = grid.generate_starting_position(side, size, match_seed)
-
     if spd <= 3:
         movement = 1
     elif spd <= 6:
@@ -129,6 +158,16 @@ def _create_creature(
     if passive == Passive.THERMAL_SOAR:
         movement += 1
 
+    return (animal, stats, passive, abilities, size, derived, movement)
+
+
+def _creature_from_template(
+    template: tuple, side: str, match_seed: int,
+) -> Creature:
+    """Instantiate a Creature from a precomputed build template."""
+    animal, stats, passive, abilities, size, derived, movement = template
+    position = _GRID.generate_starting_position(side, size, match_seed)
+
     return Creature(
         animal=animal,
         stats=stats,
@@ -146,93 +185,140 @@ def _create_creature(
     )
 
 
+def _create_creature(
+    animal: Animal, hp: int, atk: int, spd: int, wil: int,
+    side: str, match_seed: int,
+) -> Creature:
+    """Create a Creature from raw build parameters."""
+    template = _build_template(animal, hp, atk, spd, wil)
+    return _creature_from_template(template, side, match_seed)
+
+
 def _run_games(
     animal_a: Animal, hp_a: int, atk_a: int, spd_a: int, wil_a: int,
     animal_b: Animal, hp_b: int, atk_b: int, spd_b: int, wil_b: int,
     num_games: int, base_seed: int,
     verbose_game: int | None = None,
+    engine: CombatEngine | None = None,
 ) -> dict[str, Any]:
-    """Run N games between two builds, returning aggregate results."""
-    engine = CombatEngine()
-    wins_a = 0
-    wins_b = 0
-    draws = 0
+    """Run N games between two builds, returning aggregate results.
+
+    Callers running many pairings (round-robin) pass a shared engine so
+    its construction cost is paid once, not per pair.
+    """
+    if engine is None:
+        engine = CombatEngine()
+    counts = [0, 0, 0]
     total_ticks = 0
 
+    # Both builds are constant across the loop, so everything except the
+    # seeded starting position is computed once up front.
+    template_a = _build_template(animal_a, hp_a, atk_a, spd_a, wil_a)
+    template_b = _build_template(animal_b, hp_b, atk_b, spd_b, wil_b)
+
     for i in range(num_games):
         match_seed = base_seed + i
-        creature_a = _create_creature(animal_a, hp_a, atk_a, spd_a, wil_a, "a", match_seed)
-        creature_b = _create_creature(animal_b, hp_b, atk_b, spd_b, wil_b, "b", match_seed)
+        creature_a = _creature_from_template(template_a, "a", match_seed)
+        creature_b = _creature_from_template(template_b, "b", match_seed)
 
         result = engine.run_combat(creature_a, creature_b, match_seed)
         total_ticks += result.ticks
-
-        if result.winner == "a":
-            wins_a += 1
-        elif result.winner == "b":
-            wins_b += 1
-        else:
-            draws += 1
+        counts[_WINNER_IDX.get(result.winner, 2)] += 1
 
         if verbose_game is not None and i == verbose_game:
             _print_verbose_log(result, match_seed)
 
     avg_ticks = total_ticks / num_games if num_games > 0 else 0
     return {
-        "wins_a": wins_a,
-        "wins_b": wins_b,
-        "draws": draws,
+        "wins_a": counts[0],
+        "wins_b": counts[1],
+        "draws": counts[2],
         "avg_ticks": avg_ticks,
         "num_games": num_games,
     }
 
 
+def _fmt_attack(ev: dict, tick: int, side: str) -> str:
+    dodged = " (dodged)" if ev.get("dodged") else ""
+    return (
+        f"  Tick {tick:2d} | {side} attacks: "
+        f"{ev['damage']} dmg{dodged}, "
+        f"target HP={ev['hp_remaining']}"
+    )
+
+
+def _fmt_move(ev: dict, tick: int, side: str) -> str:
+    return f"  Tick {tick:2d} | {side} moves to {ev['to']}"
+
+
+def _fmt_ability_proc(ev: dict, tick: int, side: str) -> str:
+    return f"  Tick {tick:2d} | {side} procs {ev['ability']}"
+
+
+def _fmt_ability_resisted(ev: dict, tick: int, side: str) -> str:
+    return f"  Tick {tick:2d} | {side}'s {ev['ability']} resisted"
+
+
+def _fmt_dot(ev: dict, tick: int, side: str) -> str:
+    return (
+        f"  Tick {tick:2d} | {side} takes {ev['damage']} DOT, "
+        f"HP={ev['hp_remaining']}"
+    )
+
+
+def _fmt_ring_damage(ev: dict, tick: int, side: str) -> str:
+    return (
+        f"  Tick {tick:2d} | {side} takes {ev['damage']} ring dmg, "
+        f"HP={ev['hp_remaining']}"
+    )
+
+
+def _fmt_second_wind(ev: dict, tick: int, side: str) -> str:
+    return (
+        f"  Tick {tick:2d} | {side} Second Wind! "
+        f"+{ev['heal']} HP={ev['hp_remaining']}"
+    )
+
+
+def _fmt_skip_attack(ev: dict, tick: int, side: str) -> str:
+    return f"  Tick {tick:2d} | {side} skips attack (stunned)"
+
+
+_EVENT_FORMATTERS = {
+    "attack": _fmt_attack,
+    "move": _fmt_move,
+    "ability_proc": _fmt_ability_proc,
+    "ability_resisted": _fmt_ability_resisted,
+    "dot": _fmt_dot,
+    "ring_damage": _fmt_ring_damage,
+    "second_wind": _fmt_second_wind,
+    "skip_attack": _fmt_skip_attack,
+}
+
+
 def _print_verbose_log(result: CombatResult, match_seed: int) -> None:
-    """Print tick-by-tick combat log for one game."""
-    print(f"\n--- Verbose Log (seed={match_seed}) ---")
+    """Print tick-by-tick combat log for one game.
+
+    Lines are accumulated and flushed with a single write so verbose
+    mode costs one stdout syscall instead of one per event; per-type
+    formatting goes through a dispatch table instead of an elif chain.
+    """
+    out = [f"\n--- Verbose Log (seed={match_seed}) ---"]
     for entry in result.log:
         tick = entry["tick"]
         events = entry["events"]
         if not events:
             continue
         for ev in events:
-            etype = ev["type"]
-            side = ev.get("side", "?")
-            if etype == "attack":
-                dodged = " (dodged)" if ev.get("dodged") else ""
-                print(
-                    f"  Tick {tick:2d} | {side} attacks: "
-                    f"{ev['damage']} dmg{dodged}, "
-                    f"target HP={ev['hp_remaining']}"
-                )
-            elif etype == "move":
-                print(f"  Tick {tick:2d} | {side} moves to {ev['to']}")
-            elif etype == "ability_proc":
-                print(f"  Tick {tick:2d} | {side} procs {ev['ability']}")
-            elif etype == "ability_resisted":
-                print(f"  Tick {tick:2d} | {side}'s {ev['ability']} resisted")
-            elif etype == "dot":
-                print(
-                    f"  Tick {tick:2d} | {side} takes {ev['damage']} DOT, "
-                    f"HP={ev['hp_remaining']}"
-                )
-            elif etype == "ring_damage":
-                print(
-                    f"  Tick {tick:2d} | {side} takes {ev['damage']} ring dmg, "
-                    f"HP={ev['hp_remaining']}"
-                )
-            elif etype == "second_wind":
-                print(
-                    f"  Tick {tick:2d} | {side} Second Wind! "
-                    f"+{ev['heal']} HP={ev['hp_remaining']}"
-                )
-            elif etype == "skip_attack":
-                print(f"  Tick {tick:2d} | {side} skips attack (stunned)")
-    print(
+            fmt = _EVENT_FORMATTERS.get(ev["type"])
+            if fmt is not None:
+                out.append(fmt(ev, tick, ev.get("side", "?")))
+    out.append(
         f"  Result: {'a wins' if result.winner == 'a' else 'b wins' if result.winner == 'b' else 'draw'} "
         f"in {result.ticks} ticks ({result.end_condition})"
     )
-    print("--- End Verbose Log ---\n")
+    out.append("--- End Verbose Log ---\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def _format_build(animal: Animal, hp: int, atk: int, spd: int, wil: int) -> str:
@@ -290,6 +376,11 @@ def _run_single(args: argparse.Namespace) -> None:
         print("Tie!")
 
 
+def _pair_index(i: int, j: int, n: int) -> int:
+    """Flat index of unordered pair (i, j), i < j, in condensed form."""
+    return i * n - i * (i + 1) // 2 + j - i - 1
+
+
 def _run_round_robin(args: argparse.Namespace) -> None:
     """Run round-robin mode."""
     builds = []
@@ -312,11 +403,22 @@ def _run_round_robin(args: argparse.Namespace) -> None:
     print()
 
     n = len(builds)
-    # win_rates[i][j] = win rate of build i vs build j
-    win_rates: list[list[float | None]] = [[None] * n for _ in range(n)]
-    total_wins: list[int] = [0] * n
-    total_games: list[int] = [0] * n
+    # Condensed upper-triangular storage: pair (i, j) with i < j lives at
+    # _pair_index(i, j, n). Two arrays because draws mean the lower
+    # triangle is not simply 1 - upper. n*(n-1)/2 floats instead of an
+    # n x n list-of-lists of boxed objects.
+    flat_wr_ij = np.zeros(n * (n - 1) // 2, dtype=np.float32)
+    flat_wr_ji = np.zeros(n * (n - 1) // 2, dtype=np.float32)
+    total_wins = np.zeros(n, dtype=np.int64)
+    total_games = np.zeros(n, dtype=np.int64)
+
+    # Parse once, derive once: warming every build's template here means
+    # the pair loop below does no stat math at all (first-touch included),
+    # only seeded positions and Creature construction.
+    for b in builds:
+        _build_template(*b)
 
+    engine = CombatEngine()
     pair_seed = args.seed
     for i in range(n):
         for j in range(i + 1, n):
@@ -326,19 +428,21 @@ def _run_round_robin(args: argparse.Namespace) -> None:
                 ai, hi, ati, si, wi,
                 aj, hj, atj, sj, wj,
                 args.games, pair_seed,
+                engine=engine,
             )
             pair_seed += args.games
 
             wr_i = res["wins_a"] / res["num_games"] if res["num_games"] > 0 else 0
             wr_j = res["wins_b"] / res["num_games"] if res["num_games"] > 0 else 0
-            win_rates[i][j] = wr_i
-            win_rates[j][i] = wr_j
+            flat = _pair_index(i, j, n)
+            flat_wr_ij[flat] = wr_i
+            flat_wr_ji[flat] = wr_j
             total_wins[i] += res["wins_a"]
             total_wins[j] += res["wins_b"]
             total_games[i] += res["num_games"]
             total_games[j] += res["num_games"]
 
-    # Print pairwise matrix
+    # Print pairwise matrix, reconstructed from the condensed arrays
     labels = [f"B{i+1}" for i in range(n)]
     header = f"{'':>8}" + "".join(f"{lbl:>8}" for lbl in labels)
     print("Pairwise Win Rates:")
@@ -348,24 +452,62 @@ def _run_round_robin(args: argparse.Namespace) -> None:
         for j in range(n):
             if i == j:
                 row += f"{'--':>8}"
-            elif win_rates[i][j] is not None:
-                row += f"{win_rates[i][j]:.1%}".rjust(8)
+            elif i < j:
+                row += f"{flat_wr_ij[_pair_index(i, j, n)]:.1%}".rjust(8)
             else:
-                row += f"{'?':>8}"
+                row += f"{flat_wr_ji[_pair_index(j, i, n)]:.1%}".rjust(8)
         print(row)
     print()
 
-    # Average win rate
-    avg_wrs: list[tuple[float, int]] = []
-    for i in range(n):
-        avg = total_wins[i] / total_games[i] if total_games[i] > 0 else 0
-        avg_wrs.append((avg, i))
-    avg_wrs.sort(reverse=True)
+    # Average win rate, ranked vectorized; ties keep the old tuple-sort
+    # order (higher build index first).
+    avg_wrs = np.divide(
+        total_wins, total_games,
+        out=np.zeros(n, dtype=np.float64), where=total_games > 0,
+    )
+    order = np.lexsort((-np.arange(n), -avg_wrs))
 
     print("Rankings (by average win rate):")
-    for rank, (wr, idx) in enumerate(avg_wrs, 1):
+    for rank, idx in enumerate(order, 1):
         animal, hp, atk, spd, wil = builds[idx]
-        print(f"  {rank}. {_format_build(animal, hp, atk, spd, wil)} \u2014 {wr:.1%} avg win rate")
+        print(f"  {rank}. {_format_build(animal, hp, atk, spd, wil)} \u2014 {avg_wrs[idx]:.1%} avg win rate")
+
+
+def _run_one_series(template_a: tuple, template_b: tuple, series_seed: int) -> tuple[str, int]:
+    """Run one best-of-7 series; returns (winner, games_played).
+
+    Top-level so it pickles for Pool workers. The shared build templates
+    are bound via functools.partial, so only position lookup and Creature
+    construction run per game; the early exit at 4 wins is unchanged.
+    """
+    engine = CombatEngine()
+    game_wins_a = 0
+    game_wins_b = 0
+    games_played = 0
+
+    for g in range(7):
+        if game_wins_a >= 4 or game_wins_b >= 4:
+            break
+
+        match_seed = series_seed + g
+        creature_a = _creature_from_template(template_a, "a", match_seed)
+        creature_b = _creature_from_template(template_b, "b", match_seed)
+
+        result = engine.run_combat(creature_a, creature_b, match_seed)
+        games_played += 1
+
+        if result.winner == "a":
+            game_wins_a += 1
+        elif result.winner == "b":
+            game_wins_b += 1
+
+    if game_wins_a > game_wins_b:
+        winner = "a"
+    elif game_wins_b > game_wins_a:
+        winner = "b"
+    else:
+        winner = "draw"
+    return winner, games_played
 
 
 def _run_series(args: argparse.Namespace) -> None:
@@ -383,36 +525,24 @@ def _run_series(args: argparse.Namespace) -> None:
     print(f"Simulating {args.series_count} best-of-7 series...")
     print()
 
-    engine = CombatEngine()
+    template_a = _build_template(animal_a, hp_a, atk_a, spd_a, wil_a)
+    template_b = _build_template(animal_b, hp_b, atk_b, spd_b, wil_b)
+    series_seeds = [args.seed + s * 100 for s in range(args.series_count)]
+
+    # Each series is fully determined by its own seed, so fan them out
+    # across cores and tally the per-series results as they return.
+    worker = functools.partial(_run_one_series, template_a, template_b)
     series_wins_a = 0
     series_wins_b = 0
     total_games_played = 0
 
-    for s in range(args.series_count):
-        series_seed = args.seed + s * 100
-        game_wins_a = 0
-        game_wins_b = 0
-
-        for g in range(7):
-            if game_wins_a >= 4 or game_wins_b >= 4:
-                break
-
-            match_seed = series_seed + g
-            creature_a = _create_creature(animal_a, hp_a, atk_a, spd_a, wil_a, "a", match_seed)
-            creature_b = _create_creature(animal_b, hp_b, atk_b, spd_b, wil_b, "b", match_seed)
-
-            result = engine.run_combat(creature_a, creature_b, match_seed)
-            total_games_played += 1
-
-            if result.winner == "a":
-                game_wins_a += 1
-            elif result.winner == "b":
-                game_wins_b += 1
-
-        if game_wins_a > game_wins_b:
-            series_wins_a += 1
-        elif game_wins_b > game_wins_a:
-            series_wins_b += 1
+    with multiprocessing.Pool() as pool:
+        for winner, games_played in pool.map(worker, series_seeds):
+            total_games_played += games_played
+            if winner == "a":
+                series_wins_a += 1
+            elif winner == "b":
+                series_wins_b += 1
 
     print("Series Results:")
     print(f"  Build 1 wins: {series_wins_a}/{args.series_count} series")
@@ -428,6 +558,39 @@ def _run_series(args: argparse.Namespace) -> None:
         print("Series tied!")
 
 
+def _validate_args(args: argparse.Namespace) -> str:
+    """Return the mode key for parsed args, raising ValueError if incomplete."""
+    if args.round_robin:
+        if not args.builds or len(args.builds) < 2:
+            raise ValueError("--round-robin requires --builds with at least 2 builds")
+        return "round_robin"
+    if args.series:
+        if not args.build1 or not args.build2:
+            raise ValueError("--series requires --build1 and --build2")
+        return "series"
+    if not args.build1 or not args.build2:
+        raise ValueError("Single match mode requires --build1 and --build2")
+    return "single"
+
+
+# Mode key -> runner; built once so harnesses that call run() in a loop
+# dispatch through a dict lookup instead of re-walking an if/elif chain.
+_MODES = {
+    "round_robin": _run_round_robin,
+    "series": _run_series,
+    "single": _run_single,
+}
+
+
+def run(args: argparse.Namespace) -> None:
+    """Validate and dispatch parsed args to the selected mode.
+
+    Importable entry point for batch harnesses that build a Namespace
+    programmatically instead of shelling out to the CLI.
+    """
+    _MODES[_validate_args(args)](args)
+
+
 def main() -> None:
     """Entry point for the simulator CLI."""
     parser = argparse.ArgumentParser(
@@ -486,18 +649,7 @@ def main() -> None:
     args = parser.parse_args()
 
     try:
-        if args.round_robin:
-            if not args.builds or len(args.builds) < 2:
-                parser.error("--round-robin requires --builds with at least 2 builds")
-            _run_round_robin(args)
-        elif args.series:
-            if not args.build1 or not args.build2:
-                parser.error("--series requires --build1 and --build2")
-            _run_series(args)
-        else:
-            if not args.build1 or not args.build2:
-                parser.error("Single match mode requires --build1 and --build2")
-            _run_single(args)
+        run(args)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
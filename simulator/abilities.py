@@ -1,598 +1,634 @@
-"""Ability system — proc rolls, buff tracking, effect application.
-
-Standalone version for the companion repository.
-"""
-
-from __future__ import annotations
-
-import dataclasses
-import math
-from typing import Any
-
-from simulator.animals import (
-    Ability,
-    AbilityBuff,
-    AbilityType,
-    ActiveEffect,
-    ANIMAL_ABILITIES,
-    Creature,
-    Passive,
-)
-from simulator.seed import derive_proc_seed, seeded_bool, seeded_random
-
-# Abilities that Mimic cannot copy
-MIMIC_BLOCKED = frozenset({
-    AbilityType.IRON_WILL,
-    AbilityType.LAST_STAND,
-    AbilityType.MIMIC,
-})
-
-
-# -- Proc system --------------------------------------------------------------
-
-
-def roll_ability_procs(
-    creature: Creature,
-    opponent: Creature,
-    match_seed: int,
-    tick: int,
-    creature_index: int,
-    side: str,
-    events: list[dict[str, Any]],
-) -> tuple[Creature, Creature]:
-    """Roll ability procs for a creature, applying WIL resist checks."""
-    last_procced: AbilityType | None = None
-    for ability_index, ability in enumerate(creature.abilities):
-        if ability.is_single_charge:
-            if (
-                ability.ability_type == AbilityType.IRON_WILL
-                and creature.iron_will_used
-            ):
-                continue
-            if (
-                ability.ability_type == AbilityType.LAST_STAND
-                and creature.last_stand_used
-            ):
-                continue
-
-        # Last Stand only procs when HP < 15%
-        if ability.ability_type == AbilityType.LAST_STAND:
-            if creature.current_hp >= creature.max_hp * 0.15:
-                continue
-
-        proc_seed = derive_proc_seed(
-            match_seed, tick, creature_index, ability_index,
-        )
-        eff_proc = ability.proc_chance + creature.stats.wil * 0.0008
-        if not seeded_bool(proc_seed, eff_proc):
-            continue
-
-        resist_seed = proc_seed + 7
-        wil_resist_chance = min(0.60, opponent.stats.wil * 0.033)
-        if seeded_bool(resist_seed, wil_resist_chance):
-            events.append({
-                "type": "ability_resisted",
-                "side": side,
-                "ability": ability.ability_type.value,
-            })
-            continue
-
-        # Trick reflection: opponent's Trick buff negates this proc
-        trick_idx = _find_trick_buff_index(opponent)
-        if trick_idx is not None:
-            new_buffs = [
-                b for i, b in enumerate(opponent.active_buffs) if i != trick_idx
-            ]
-            opponent = dataclasses.replace(opponent, active_buffs=new_buffs)
-            events.append({
-                "type": "trick_reflected",
-                "side": side,
-                "ability": ability.ability_type.value,
-            })
-            continue
-
-        creature, opponent = _apply_ability_proc(
-            creature, opponent, ability, side, events, proc_seed,
-        )
-        last_procced = ability.ability_type
-
-    if last_procced is not None:
-        creature = dataclasses.replace(
-            creature, last_ability_procced=last_procced,
-        )
-    return creature, opponent
-
-
-def _apply_ability_proc(
-    creature: Creature,
-    opponent: Creature,
-    ability: Ability,
-    side: str,
-    events: list[dict[str, Any]],
-    proc_seed: int,
-) -> tuple[Creature, Creature]:
-    """Apply a single ability proc effect."""
-    atype = ability.ability_type
-
-    # Single-charge: mark as used
-    if ability.is_single_charge:
-        if atype == AbilityType.IRON_WILL:
-            creature = dataclasses.replace(creature, iron_will_used=True)
-        elif atype == AbilityType.LAST_STAND:
-            creature = dataclasses.replace(creature, last_stand_used=True)
-
-    # -- Self-buff abilities (duration or instant) --
-
-    if atype == AbilityType.BERSERKER_RAGE:
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.THICK_HIDE_ABILITY:
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.PACK_HOWL:
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype in (
-        AbilityType.POUNCE,
-        AbilityType.CHAOS_STRIKE,
-        AbilityType.GORE,
-        AbilityType.STAMPEDE,
-        AbilityType.LAST_STAND,
-        AbilityType.DIVE,
-    ):
-        # Instant "next hit" buffs -- 1-tick duration
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-        # Stampede and Pounce make opponent skip next attack
-        if atype in (AbilityType.STAMPEDE, AbilityType.POUNCE):
-            opponent = dataclasses.replace(
-                opponent, skip_next_attack=True,
-            )
-
-    # -- Phase 3: Self-buff abilities (duration) --
-
-    elif atype == AbilityType.KEEN_EYE:
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.EVASION:
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.COIL:
-        # Guaranteed dodge for 1 tick
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.TRICK:
-        # Negate next opponent proc -- 1 tick
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.EXOSKELETON:
-        # Block damage up to 15% max_hp -- 1 tick
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    # -- Instant effects --
-
-    elif atype == AbilityType.IRON_WILL:
-        heal = math.floor(creature.max_hp * 0.12)
-        new_hp = min(creature.max_hp, creature.current_hp + heal)
-        creature = dataclasses.replace(creature, current_hp=new_hp)
-
-    # -- Opponent-affecting abilities --
-
-    elif atype == AbilityType.HAMSTRING:
-        debuff = AbilityBuff(atype, ability.duration, side)
-        opponent = dataclasses.replace(
-            opponent,
-            active_buffs=[*opponent.active_buffs, debuff],
-        )
-
-    elif atype == AbilityType.REND_ABILITY:
-        dot_dmg = max(1, math.floor(creature.max_hp * 0.05))
-        bleed = ActiveEffect(
-            name="ability_rend",
-            remaining_ticks=3,
-            damage_per_tick=dot_dmg,
-        )
-        opponent = dataclasses.replace(
-            opponent,
-            active_effects=[*opponent.active_effects, bleed],
-        )
-
-    elif atype == AbilityType.VENOM:
-        # Stacking poison DOT: 3% of opponent max_hp per tick, 3 ticks, max 3 stacks
-        existing_venoms = [
-            e for e in opponent.active_effects if e.name == "ability_venom"
-        ]
-        if len(existing_venoms) < 3:
-            dot_dmg = max(1, math.floor(opponent.max_hp * 0.03))
-            venom = ActiveEffect(
-                name="ability_venom",
-                remaining_ticks=3,
-                damage_per_tick=dot_dmg,
-            )
-            opponent = dataclasses.replace(
-                opponent,
-                active_effects=[*opponent.active_effects, venom],
-            )
-
-    elif atype == AbilityType.STING:
-        # Paralyze -- opponent skips next attack
-        opponent = dataclasses.replace(
-            opponent, skip_next_attack=True,
-        )
-
-    # -- Phase 4: Rhino, Panther, Hawk, Viper --
-
-    elif atype == AbilityType.HORN_SLAM:
-        # Rhino: high damage on first hit -- 1-tick buff
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.RHINO_TRAMPLE:
-        # Rhino: AoE damage -- instant damage (no stun)
-        dmg_amount = max(1, math.floor(creature.base_dmg * 0.25))
-        opponent = dataclasses.replace(
-            opponent,
-            current_hp=opponent.current_hp - dmg_amount,
-        )
-
-    elif atype == AbilityType.SHADOW_POUNCE:
-        # Panther: gap closer + damage -- 1-tick buff
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.FADE_OUT:
-        # Panther: dodge boost for 2 ticks
-        buff = AbilityBuff(atype, ability.duration, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.DIVE_STRIKE:
-        # Hawk: high damage from range -- 1-tick buff
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.SCREECH_DEBUFF:
-        # Hawk: reduce enemy accuracy (debuff on opponent)
-        debuff = AbilityBuff(atype, ability.duration, side)
-        opponent = dataclasses.replace(
-            opponent,
-            active_buffs=[*opponent.active_buffs, debuff],
-        )
-
-    elif atype == AbilityType.QUICK_STRIKE:
-        # Viper: fast attack -- 1-tick buff
-        buff = AbilityBuff(atype, 1, side)
-        creature = dataclasses.replace(
-            creature,
-            active_buffs=[*creature.active_buffs, buff],
-        )
-
-    elif atype == AbilityType.CONSTRICT_STUN:
-        # Viper: stun for 1 tick
-        opponent = dataclasses.replace(
-            opponent, skip_next_attack=True,
-        )
-
-    # -- Mimic --
-
-    elif atype == AbilityType.MIMIC:
-        creature, opponent = _apply_mimic(
-            creature, opponent, side, events, proc_seed,
-        )
-
-    events.append({
-        "type": "ability_proc",
-        "side": side,
-        "ability": atype.value,
-        "duration": ability.duration,
-    })
-
-    return creature, opponent
-
-
-def _apply_mimic(
-    creature: Creature,
-    opponent: Creature,
-    side: str,
-    events: list[dict[str, Any]],
-    proc_seed: int,
-) -> tuple[Creature, Creature]:
-    """Apply Mimic: copy opponent's last procced ability at 75% strength."""
-    target_ability = opponent.last_ability_procced
-    if target_ability is None or not can_mimic(target_ability):
-        return creature, opponent
-
-    # Find the original ability definition
-    original: Ability | None = None
-    for animal_abilities in ANIMAL_ABILITIES.values():
-        for ab in animal_abilities:
-            if ab.ability_type == target_ability:
-                original = ab
-                break
-        if original is not None:
-            break
-
-    if original is None:
-        return creature, opponent
-
-    # Copy as mimic buff at 75% strength (1-tick delay handled naturally)
-    duration = max(1, original.duration) if original.duration > 0 else 1
-    buff = AbilityBuff(
-        ability_type=target_ability,
-        remaining_ticks=duration,
-        source_side=side,
-        is_mimic_copy=True,
-    )
-    creature = dataclasses.replace(
-        creature,
-        active_buffs=[*creature.active_buffs, buff],
-    )
-
-    return creature, opponent
-
-
-# -- Attack modifiers from ability buffs ---------------------------------------
-
-
-def apply_ability_attack_mods(
-    attacker: Creature,
-    atk_mod: float,
-    hit_seed: int,
-) -> tuple[Creature, float]:
-    """Apply ATK modifiers from active ability buffs."""
-    for buff in attacker.active_buffs:
-        mimic_scale = 0.75 if buff.is_mimic_copy else 1.0
-
-        if buff.ability_type == AbilityType.PACK_HOWL:
-            atk_mod *= 1.0 + 0.30 * mimic_scale
-
-        elif buff.ability_type == AbilityType.POUNCE:
-            atk_mod *= 1.0 + 0.70 * mimic_scale
-
-        elif buff.ability_type == AbilityType.STAMPEDE:
-            atk_mod *= 1.0 + 0.50 * mimic_scale
-
-        elif buff.ability_type == AbilityType.LAST_STAND:
-            if attacker.current_hp < attacker.max_hp * 0.15:
-                atk_mod *= 1.0 + 1.0 * mimic_scale
-
-        elif buff.ability_type == AbilityType.GORE:
-            atk_mod *= 0.60
-
-        elif buff.ability_type == AbilityType.CHAOS_STRIKE:
-            chaos_mod = get_chaos_strike_mod(hit_seed + 777)
-            if buff.is_mimic_copy:
-                # 75% strength: narrow range toward 1.0
-                chaos_mod = 1.0 + (chaos_mod - 1.0) * 0.75
-            atk_mod = chaos_mod
-
-        elif buff.ability_type == AbilityType.DIVE:
-            atk_mod *= 1.0 + 1.0 * mimic_scale
-
-        # Phase 4 attack mods
-        elif buff.ability_type == AbilityType.HORN_SLAM:
-            atk_mod *= 1.0 + 0.30 * mimic_scale
-
-        elif buff.ability_type == AbilityType.SHADOW_POUNCE:
-            atk_mod *= 1.0 + 0.60 * mimic_scale
-
-        elif buff.ability_type == AbilityType.DIVE_STRIKE:
-            atk_mod *= 1.0 + 0.90 * mimic_scale
-
-        elif buff.ability_type == AbilityType.QUICK_STRIKE:
-            atk_mod *= 1.0 + 0.25 * mimic_scale
-
-    return attacker, atk_mod
-
-
-# -- Buff queries --------------------------------------------------------------
-
-
-def has_buff(creature: Creature, ability_type: AbilityType) -> bool:
-    """Check if creature has an active buff of the given type."""
-    return any(
-        b.ability_type == ability_type for b in creature.active_buffs
-    )
-
-
-def has_ignore_dodge_buff(creature: Creature) -> bool:
-    """Check if creature has a buff that ignores dodge (Pounce, Gore, or Dive)."""
-    return any(
-        b.ability_type in (AbilityType.POUNCE, AbilityType.GORE, AbilityType.DIVE)
-        for b in creature.active_buffs
-    )
-
-
-def get_effective_dodge(creature: Creature) -> float:
-    """Calculate effective dodge chance accounting for ability buffs/debuffs."""
-    # Coil: guaranteed dodge, overrides everything
-    for buff in creature.active_buffs:
-        if buff.ability_type == AbilityType.COIL:
-            return 1.0
-
-    dodge = creature.dodge_chance
-
-    # Additive dodge bonuses (Keen Eye, Evasion)
-    for buff in creature.active_buffs:
-        if buff.ability_type == AbilityType.KEEN_EYE:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge += 0.20 * scale
-
-        elif buff.ability_type == AbilityType.EVASION:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge += 0.50 * scale
-
-        elif buff.ability_type == AbilityType.FADE_OUT:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge += 0.40 * scale
-
-    # Screech Debuff: reduce accuracy (acts like dodge buff on the creature being debuffed)
-    for buff in creature.active_buffs:
-        if buff.ability_type == AbilityType.SCREECH_DEBUFF:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge += 0.15 * scale
-
-    # Berserker Rage: -40% dodge
-    for buff in creature.active_buffs:
-        if buff.ability_type == AbilityType.BERSERKER_RAGE:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge *= (1.0 - 0.40 * scale)
-
-    # Hamstring: SPD -55% + flat -10% dodge
-    for buff in creature.active_buffs:
-        if buff.ability_type == AbilityType.HAMSTRING:
-            scale = 0.75 if buff.is_mimic_copy else 1.0
-            dodge *= (1.0 - 0.55 * scale)
-            dodge -= 0.10 * scale
-
-    return max(0.0, min(1.0, dodge))
-
-
-def can_mimic(ability_type: AbilityType) -> bool:
-    """Check if an ability type can be copied by Mimic."""
-    return ability_type not in MIMIC_BLOCKED
-
-
-# -- Defense from ability buffs ------------------------------------------------
-
-
-def apply_ability_defense(
-    defender: Creature, dmg: int,
-) -> tuple[Creature, int]:
-    """Apply defensive ability effects (Thick Hide block, Exoskeleton)."""
-    # Check for Thick Hide first (full block, highest priority)
-    has_thick_hide = any(
-        b.ability_type == AbilityType.THICK_HIDE_ABILITY
-        for b in defender.active_buffs
-    )
-    if has_thick_hide:
-        remaining = [
-            b for b in defender.active_buffs
-            if b.ability_type != AbilityType.THICK_HIDE_ABILITY
-        ]
-        return dataclasses.replace(defender, active_buffs=remaining), 0
-
-    # Check for Exoskeleton (partial block up to 15% max_hp)
-    has_exo = any(
-        b.ability_type == AbilityType.EXOSKELETON
-        for b in defender.active_buffs
-    )
-    if has_exo:
-        remaining = [
-            b for b in defender.active_buffs
-            if b.ability_type != AbilityType.EXOSKELETON
-        ]
-        block_amount = math.floor(defender.max_hp * 0.15)
-        dmg = max(0, dmg - block_amount)
-        return dataclasses.replace(defender, active_buffs=remaining), dmg
-
-    return defender, dmg
-
-
-# -- Fury C3 -------------------------------------------------------------------
-
-
-def check_fury_trigger(creature: Creature) -> Creature:
-    """Check and trigger Fury Protocol (< 50% HP, 3-tick window)."""
-    if creature.passive != Passive.FURY_PROTOCOL:
-        return creature
-    if creature.fury_triggered:
-        return creature
-    if creature.current_hp >= creature.max_hp * 0.5:
-        return creature
-    return dataclasses.replace(
-        creature,
-        fury_triggered=True,
-        fury_active_ticks=3,
-    )
-
-
-def tick_fury(creature: Creature) -> Creature:
-    """Decrement Fury active ticks."""
-    if creature.fury_active_ticks <= 0:
-        return creature
-    return dataclasses.replace(
-        creature,
-        fury_active_ticks=creature.fury_active_ticks - 1,
-    )
-
-
-# -- Buff management -----------------------------------------------------------
-
-
-def tick_ability_buffs(creature: Creature) -> Creature:
-    """Tick down all ability buff durations, removing expired ones."""
-    if not creature.active_buffs:
-        return creature
-    remaining = [
-        AbilityBuff(
-            ability_type=buff.ability_type,
-            remaining_ticks=buff.remaining_ticks - 1,
-            source_side=buff.source_side,
-            is_mimic_copy=buff.is_mimic_copy,
-        )
-        for buff in creature.active_buffs
-    ]
-    remaining = [b for b in remaining if b.remaining_ticks > 0]
-    return dataclasses.replace(creature, active_buffs=remaining)
-
-
-# -- Internal helpers ----------------------------------------------------------
-
-
-def get_chaos_strike_mod(seed: int) -> float:
-    return seeded_random(seed, 0.8, 2.2)
-
-
-def _find_trick_buff_index(creature: Creature) -> int | None:
-    """Find the index of an active Trick buff, or None."""
-    for i, buff in enumerate(creature.active_buffs):
-        if buff.ability_type == AbilityType.TRICK:
-            return i
-    return None
+"""Ability system — proc rolls, buff tracking, effect application.
+
+Standalone version for the companion repository.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from typing import Any
+
+from simulator.animals import (
+    Ability,
+    ABILITY_EVENT_LABELS,
+    AbilityBuff,
+    AbilityType,
+    ActiveEffect,
+    ANIMAL_ABILITIES,
+    EffectKind,
+    Creature,
+    Passive,
+)
+from simulator.seed import proc_roll, seeded_bool, seeded_random
+
+# Abilities that Mimic cannot copy
+MIMIC_BLOCKED = frozenset({
+    AbilityType.IRON_WILL,
+    AbilityType.LAST_STAND,
+    AbilityType.MIMIC,
+})
+
+# Bitmask forms of the fixed ability groups tested per hit: with
+# AbilityType an IntEnum, membership is one shift-and-AND against
+# Creature.buff_type_mask instead of a hashed set lookup.
+_MIMIC_BLOCKED_MASK = sum(1 << t for t in MIMIC_BLOCKED)
+_IGNORE_DODGE_MASK = (
+    (1 << AbilityType.POUNCE) | (1 << AbilityType.GORE) | (1 << AbilityType.DIVE)
+)
+
+
+# ANIMAL_ABILITIES is fixed at import time, so resolve Mimic's
+# type-to-definition lookup once here instead of re-scanning every
+# animal's ability list per proc. setdefault keeps the first definition
+# found, matching the old nested-loop scan order.
+_ABILITY_BY_TYPE: dict[AbilityType, Ability] = {}
+for _abilities in ANIMAL_ABILITIES.values():
+    for _ab in _abilities:
+        _ABILITY_BY_TYPE.setdefault(_ab.ability_type, _ab)
+del _abilities, _ab
+
+
+def _add_buff(creature: Creature, buff: AbilityBuff) -> None:
+    """Append a buff and keep the per-type refcount index in sync."""
+    creature.active_buffs.append(buff)
+    counts = creature.buffs_by_type
+    counts[buff.ability_type] = counts.get(buff.ability_type, 0) + 1
+    creature.buff_type_mask |= 1 << buff.ability_type
+
+
+def _remove_buffs_of_type(creature: Creature, ability_type: AbilityType) -> None:
+    """Drop every buff of the given type, updating the refcount index.
+
+    Compacts the buff list in place with a write cursor rather than
+    building a filtered copy; callers only reach this when the type is
+    known to be present.
+    """
+    buffs = creature.active_buffs
+    write = 0
+    for buff in buffs:
+        if buff.ability_type != ability_type:
+            buffs[write] = buff
+            write += 1
+    del buffs[write:]
+    creature.buffs_by_type.pop(ability_type, None)
+    creature.buff_type_mask &= ~(1 << ability_type)
+
+
+# Proc-roll events are fully determined by (kind, side, ability type,
+# duration), so each combination is built once and the shared instance
+# is appended thereafter; log consumers only ever read events.
+_EV_PROC, _EV_RESIST, _EV_REFLECT = 0, 1, 2
+_EVENT_CACHE: dict[tuple[int, str, AbilityType, int], dict[str, Any]] = {}
+
+
+def _proc_event(kind: int, side: str, ability: Ability) -> dict[str, Any]:
+    key = (kind, side, ability.ability_type, ability.duration)
+    event = _EVENT_CACHE.get(key)
+    if event is None:
+        if kind == _EV_PROC:
+            event = {
+                "type": "ability_proc",
+                "side": side,
+                "ability": ABILITY_EVENT_LABELS[ability.ability_type],
+                "duration": ability.duration,
+            }
+        elif kind == _EV_RESIST:
+            event = {
+                "type": "ability_resisted",
+                "side": side,
+                "ability": ABILITY_EVENT_LABELS[ability.ability_type],
+            }
+        else:
+            event = {
+                "type": "trick_reflected",
+                "side": side,
+                "ability": ABILITY_EVENT_LABELS[ability.ability_type],
+            }
+        _EVENT_CACHE[key] = event
+    return event
+
+
+def _churn(creature: Creature) -> Creature:
+    """Shallow-copy a creature to give its state change a fresh identity.
+
+    The grid tracks occupancy by object identity, so a creature whose
+    state changed must present a new identity at exactly the points
+    where the old copy-on-write code produced one — otherwise movement
+    resolves differently and recorded tournament replays diverge. A
+    shallow copy is much cheaper than dataclasses.replace (no __init__,
+    no per-field list rebuilds) while preserving those semantics.
+    """
+    return copy.copy(creature)
+
+
+# -- Proc system --------------------------------------------------------------
+
+
+def roll_ability_procs(
+    creature: Creature,
+    opponent: Creature,
+    match_seed: int,
+    tick: int,
+    creature_index: int,
+    side: str,
+    events: list[dict[str, Any]],
+) -> tuple[Creature, Creature]:
+    """Roll ability procs for a creature, applying WIL resist checks.
+
+    Mutates both creatures in place; the (creature, opponent) return is
+    kept for call-site compatibility.
+    """
+    if not creature.abilities:
+        return creature, opponent
+
+    # Loop-invariant terms: WIL never changes mid-combat and max_hp is
+    # fixed, so compute these once instead of per ability per tick.
+    wil_bonus = creature.stats.wil * 0.0008
+    wil_resist_chance = min(0.60, opponent.stats.wil * 0.033)
+    # Iron Will and Last Stand are the only single-charge abilities with
+    # used-state; skip their bookkeeping when the creature has neither.
+    check_charges = creature.has_iron_will or creature.has_last_stand
+
+    last_procced: AbilityType | None = None
+    for ability_index, ability in enumerate(creature.abilities):
+        atype = ability.ability_type
+        if check_charges:
+            if atype == AbilityType.IRON_WILL and creature.iron_will_used:
+                continue
+            # Last Stand: single charge, and only procs when HP < 15%
+            if atype == AbilityType.LAST_STAND and (
+                creature.last_stand_used
+                or creature.current_hp >= creature.hp_15pct
+            ):
+                continue
+
+        proc_seed, proc_passed = proc_roll(
+            match_seed, tick, creature_index, ability_index,
+            ability.proc_chance + wil_bonus,
+        )
+        if not proc_passed:
+            continue
+
+        resist_seed = proc_seed + 7
+        if seeded_bool(resist_seed, wil_resist_chance):
+            events.append(_proc_event(_EV_RESIST, side, ability))
+            continue
+
+        # Trick reflection: opponent's Trick buff negates this proc
+        trick_idx = (
+            _find_trick_buff_index(opponent) if opponent.active_buffs else None
+        )
+        if trick_idx is not None:
+            removed = opponent.active_buffs.pop(trick_idx)
+            counts = opponent.buffs_by_type
+            counts[removed.ability_type] -= 1
+            if counts[removed.ability_type] <= 0:
+                del counts[removed.ability_type]
+                opponent.buff_type_mask &= ~(1 << removed.ability_type)
+            opponent = _churn(opponent)
+            events.append(_proc_event(_EV_REFLECT, side, ability))
+            continue
+
+        creature, opponent = _apply_ability_proc(
+            creature, opponent, ability, side, events, proc_seed,
+        )
+        last_procced = atype
+
+    if last_procced is not None:
+        creature.last_ability_procced = last_procced
+        creature = _churn(creature)
+    return creature, opponent
+
+
+def _apply_ability_proc(
+    creature: Creature,
+    opponent: Creature,
+    ability: Ability,
+    side: str,
+    events: list[dict[str, Any]],
+    proc_seed: int,
+) -> tuple[Creature, Creature]:
+    """Apply a single ability proc effect.
+
+    Mutates state in place via the handler dispatch table, then
+    refreshes the identity of whichever creature(s) changed (_churn).
+    """
+    atype = ability.ability_type
+    changed_creature = False
+    changed_opponent = False
+
+    # Single-charge: mark as used
+    if ability.is_single_charge:
+        if atype == AbilityType.IRON_WILL:
+            creature.iron_will_used = True
+            changed_creature = True
+        elif atype == AbilityType.LAST_STAND:
+            creature.last_stand_used = True
+            changed_creature = True
+
+    if atype == AbilityType.MIMIC:
+        creature, opponent = _apply_mimic(
+            creature, opponent, side, events, proc_seed,
+        )
+    else:
+        handler = _PROC_HANDLERS.get(atype)
+        if handler is not None:
+            touched_creature, touched_opponent = handler(
+                creature, opponent, ability, side,
+            )
+            changed_creature = changed_creature or touched_creature
+            changed_opponent = changed_opponent or touched_opponent
+
+    if changed_creature:
+        creature = _churn(creature)
+    if changed_opponent:
+        opponent = _churn(opponent)
+
+    events.append(_proc_event(_EV_PROC, side, ability))
+
+    return creature, opponent
+
+
+# -- Proc handlers -------------------------------------------------------------
+# Each handler mutates in place and reports (changed_creature,
+# changed_opponent) so the caller can refresh identities.
+
+
+def _proc_self_buff(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    """Self-buff for the ability's full duration."""
+    _add_buff(creature, AbilityBuff(ability.ability_type, ability.duration, side))
+    return True, False
+
+
+def _proc_next_hit_buff(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    """Instant "next hit" self-buff -- 1-tick duration."""
+    atype = ability.ability_type
+    _add_buff(creature, AbilityBuff(atype, 1, side))
+    # Stampede and Pounce make opponent skip next attack
+    if atype in _SKIP_NEXT_ON_PROC:
+        opponent.skip_next_attack = True
+        return True, True
+    return True, False
+
+
+def _proc_opponent_debuff(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    """Debuff on the opponent for the ability's full duration."""
+    _add_buff(opponent, AbilityBuff(ability.ability_type, ability.duration, side))
+    return False, True
+
+
+def _proc_stun(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    """Opponent skips next attack (Sting paralyze, Constrict stun)."""
+    opponent.skip_next_attack = True
+    return False, True
+
+
+def _proc_iron_will(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    creature.current_hp = min(
+        creature.max_hp, creature.current_hp + creature.iron_will_heal,
+    )
+    return True, False
+
+
+def _proc_rend(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    opponent.active_effects.append(ActiveEffect(
+        kind=EffectKind.REND,
+        remaining_ticks=3,
+        damage_per_tick=creature.rend_dot_dmg,
+    ))
+    return False, True
+
+
+def _proc_venom(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    # Stacking poison DOT: 3% of opponent max_hp per tick, 3 ticks, max 3 stacks
+    if opponent.venom_stacks < 3:
+        opponent.venom_stacks += 1
+        opponent.active_effects.append(ActiveEffect(
+            kind=EffectKind.VENOM,
+            remaining_ticks=3,
+            damage_per_tick=opponent.venom_dot_dmg,
+        ))
+        return False, True
+    return False, False
+
+
+def _proc_trample(
+    creature: Creature, opponent: Creature, ability: Ability, side: str,
+) -> tuple[bool, bool]:
+    # Rhino: AoE damage -- instant damage (no stun)
+    dmg_amount = max(1, math.floor(creature.base_dmg * 0.25))
+    opponent.current_hp -= dmg_amount
+    return False, True
+
+
+_SKIP_NEXT_ON_PROC = frozenset({AbilityType.STAMPEDE, AbilityType.POUNCE})
+
+# Duration self-buffs (Berserker Rage, Thick Hide, Pack Howl, Keen Eye,
+# Evasion, Fade Out) share one handler; 1-tick "next hit" buffs (incl.
+# Coil's guaranteed dodge, Trick's proc negation and Exoskeleton's
+# damage block) share another. Unique effects keep their own handlers.
+_PROC_HANDLERS: dict[AbilityType, Any] = {
+    AbilityType.BERSERKER_RAGE: _proc_self_buff,
+    AbilityType.THICK_HIDE_ABILITY: _proc_self_buff,
+    AbilityType.PACK_HOWL: _proc_self_buff,
+    AbilityType.KEEN_EYE: _proc_self_buff,
+    AbilityType.EVASION: _proc_self_buff,
+    AbilityType.FADE_OUT: _proc_self_buff,
+    AbilityType.POUNCE: _proc_next_hit_buff,
+    AbilityType.CHAOS_STRIKE: _proc_next_hit_buff,
+    AbilityType.GORE: _proc_next_hit_buff,
+    AbilityType.STAMPEDE: _proc_next_hit_buff,
+    AbilityType.LAST_STAND: _proc_next_hit_buff,
+    AbilityType.DIVE: _proc_next_hit_buff,
+    AbilityType.COIL: _proc_next_hit_buff,
+    AbilityType.TRICK: _proc_next_hit_buff,
+    AbilityType.EXOSKELETON: _proc_next_hit_buff,
+    AbilityType.HORN_SLAM: _proc_next_hit_buff,
+    AbilityType.SHADOW_POUNCE: _proc_next_hit_buff,
+    AbilityType.DIVE_STRIKE: _proc_next_hit_buff,
+    AbilityType.QUICK_STRIKE: _proc_next_hit_buff,
+    AbilityType.HAMSTRING: _proc_opponent_debuff,
+    AbilityType.SCREECH_DEBUFF: _proc_opponent_debuff,
+    AbilityType.STING: _proc_stun,
+    AbilityType.CONSTRICT_STUN: _proc_stun,
+    AbilityType.IRON_WILL: _proc_iron_will,
+    AbilityType.REND_ABILITY: _proc_rend,
+    AbilityType.VENOM: _proc_venom,
+    AbilityType.RHINO_TRAMPLE: _proc_trample,
+}
+
+
+def _apply_mimic(
+    creature: Creature,
+    opponent: Creature,
+    side: str,
+    events: list[dict[str, Any]],
+    proc_seed: int,
+) -> tuple[Creature, Creature]:
+    """Apply Mimic: copy opponent's last procced ability at 75% strength."""
+    target_ability = opponent.last_ability_procced
+    if target_ability is None or not can_mimic(target_ability):
+        return creature, opponent
+
+    # Find the original ability definition
+    original = _ABILITY_BY_TYPE.get(target_ability)
+    if original is None:
+        return creature, opponent
+
+    # Copy as mimic buff at 75% strength (1-tick delay handled naturally)
+    duration = max(1, original.duration) if original.duration > 0 else 1
+    _add_buff(creature, AbilityBuff(
+        ability_type=target_ability,
+        remaining_ticks=duration,
+        source_side=side,
+        is_mimic_copy=True,
+    ))
+    return _churn(creature), opponent
+
+
+# -- Attack modifiers from ability buffs ---------------------------------------
+
+
+def compute_attack_mods(
+    attacker: Creature,
+    atk_mod: float,
+    hit_seed: int,
+) -> tuple[float, bool]:
+    """Fold attack-side buff effects for one hit into a single scan.
+
+    Returns the adjusted ATK modifier and whether the hit ignores dodge
+    (Pounce, Gore, or Dive active), replacing the separate
+    apply_ability_attack_mods + has_ignore_dodge_buff calls. The
+    attacker itself is never modified here.
+    """
+    if not attacker.active_buffs:
+        return atk_mod, False
+
+    for buff in attacker.active_buffs:
+        # LOAD_FAST locals: each elif below would otherwise re-read the
+        # attribute per comparison.
+        atype = buff.ability_type
+        mimic_scale = 0.75 if buff.is_mimic_copy else 1.0
+
+        if atype == AbilityType.PACK_HOWL:
+            atk_mod *= 1.0 + 0.30 * mimic_scale
+
+        elif atype == AbilityType.POUNCE:
+            atk_mod *= 1.0 + 0.70 * mimic_scale
+
+        elif atype == AbilityType.STAMPEDE:
+            atk_mod *= 1.0 + 0.50 * mimic_scale
+
+        elif atype == AbilityType.LAST_STAND:
+            if attacker.current_hp < attacker.hp_15pct:
+                atk_mod *= 1.0 + 1.0 * mimic_scale
+
+        elif atype == AbilityType.GORE:
+            atk_mod *= 0.60
+
+        elif atype == AbilityType.CHAOS_STRIKE:
+            chaos_mod = get_chaos_strike_mod(hit_seed + 777)
+            if buff.is_mimic_copy:
+                # 75% strength: narrow range toward 1.0
+                chaos_mod = 1.0 + (chaos_mod - 1.0) * 0.75
+            atk_mod = chaos_mod
+
+        elif atype == AbilityType.DIVE:
+            atk_mod *= 1.0 + 1.0 * mimic_scale
+
+        # Phase 4 attack mods
+        elif atype == AbilityType.HORN_SLAM:
+            atk_mod *= 1.0 + 0.30 * mimic_scale
+
+        elif atype == AbilityType.SHADOW_POUNCE:
+            atk_mod *= 1.0 + 0.60 * mimic_scale
+
+        elif atype == AbilityType.DIVE_STRIKE:
+            atk_mod *= 1.0 + 0.90 * mimic_scale
+
+        elif atype == AbilityType.QUICK_STRIKE:
+            atk_mod *= 1.0 + 0.25 * mimic_scale
+
+    return atk_mod, has_ignore_dodge_buff(attacker)
+
+
+# -- Buff queries --------------------------------------------------------------
+
+
+def has_buff(creature: Creature, ability_type: AbilityType) -> bool:
+    """Check if creature has an active buff of the given type."""
+    return bool(creature.buff_type_mask & (1 << ability_type))
+
+
+def has_ignore_dodge_buff(creature: Creature) -> bool:
+    """Check if creature has a buff that ignores dodge (Pounce, Gore, or Dive)."""
+    return bool(creature.buff_type_mask & _IGNORE_DODGE_MASK)
+
+
+# Buff types that affect effective dodge (besides Coil), used to skip
+# the buff scan entirely when none are active.
+_DODGE_BUFF_MASK = (
+    (1 << AbilityType.KEEN_EYE)
+    | (1 << AbilityType.EVASION)
+    | (1 << AbilityType.FADE_OUT)
+    | (1 << AbilityType.SCREECH_DEBUFF)
+    | (1 << AbilityType.BERSERKER_RAGE)
+    | (1 << AbilityType.HAMSTRING)
+)
+
+
+def get_effective_dodge(creature: Creature) -> float:
+    """Calculate effective dodge chance accounting for ability buffs/debuffs."""
+    mask = creature.buff_type_mask
+
+    # Coil: guaranteed dodge, overrides everything
+    if mask & (1 << AbilityType.COIL):
+        return 1.0
+
+    dodge = creature.dodge_chance
+    if not mask & _DODGE_BUFF_MASK:
+        return max(0.0, min(1.0, dodge))
+
+    # One scan, grouped by category; categories are then applied in the
+    # original pass order (additive bonuses, Screech, Berserker,
+    # Hamstring) so float rounding matches the multi-pass version.
+    additive: list[float] = []
+    screech: list[float] = []
+    berserker: list[float] = []
+    hamstring: list[float] = []
+    for buff in creature.active_buffs:
+        atype = buff.ability_type
+        scale = 0.75 if buff.is_mimic_copy else 1.0
+        if atype == AbilityType.KEEN_EYE:
+            additive.append(0.20 * scale)
+        elif atype == AbilityType.EVASION:
+            additive.append(0.50 * scale)
+        elif atype == AbilityType.FADE_OUT:
+            additive.append(0.40 * scale)
+        elif atype == AbilityType.SCREECH_DEBUFF:
+            screech.append(0.15 * scale)
+        elif atype == AbilityType.BERSERKER_RAGE:
+            berserker.append(scale)
+        elif atype == AbilityType.HAMSTRING:
+            hamstring.append(scale)
+
+    for bonus in additive:
+        dodge += bonus
+    for bonus in screech:
+        dodge += bonus
+    for scale in berserker:
+        dodge *= (1.0 - 0.40 * scale)
+    for scale in hamstring:
+        dodge *= (1.0 - 0.55 * scale)
+        dodge -= 0.10 * scale
+
+    return max(0.0, min(1.0, dodge))
+
+
+def can_mimic(ability_type: AbilityType) -> bool:
+    """Check if an ability type can be copied by Mimic."""
+    return not _MIMIC_BLOCKED_MASK >> ability_type & 1
+
+
+# -- Defense from ability buffs ------------------------------------------------
+
+
+def apply_ability_defense(
+    defender: Creature, dmg: int,
+) -> tuple[Creature, int]:
+    """Apply defensive ability effects (Thick Hide block, Exoskeleton)."""
+    # Check for Thick Hide first (full block, highest priority)
+    if defender.buff_type_mask & (1 << AbilityType.THICK_HIDE_ABILITY):
+        _remove_buffs_of_type(defender, AbilityType.THICK_HIDE_ABILITY)
+        return _churn(defender), 0
+
+    # Check for Exoskeleton (partial block up to 15% max_hp)
+    if defender.buff_type_mask & (1 << AbilityType.EXOSKELETON):
+        _remove_buffs_of_type(defender, AbilityType.EXOSKELETON)
+        block_amount = math.floor(defender.hp_15pct)
+        dmg = max(0, dmg - block_amount)
+        return _churn(defender), dmg
+
+    return defender, dmg
+
+
+# -- Fury C3 -------------------------------------------------------------------
+
+
+def check_fury_trigger(creature: Creature) -> Creature:
+    """Check and trigger Fury Protocol (< 50% HP, 3-tick window)."""
+    if creature.passive != Passive.FURY_PROTOCOL:
+        return creature
+    if creature.fury_triggered:
+        return creature
+    if creature.current_hp >= creature.hp_50pct:
+        return creature
+    creature.fury_triggered = True
+    creature.fury_active_ticks = 3
+    return _churn(creature)
+
+
+def tick_fury(creature: Creature) -> Creature:
+    """Decrement Fury active ticks."""
+    if creature.fury_active_ticks <= 0:
+        return creature
+    creature.fury_active_ticks -= 1
+    return _churn(creature)
+
+
+# -- Buff management -----------------------------------------------------------
+
+
+def tick_ability_buffs(creature: Creature) -> Creature:
+    """Tick down all ability buff durations, removing expired ones."""
+    buffs = creature.active_buffs
+    if not buffs:
+        return creature
+    # Decrement and compact in place: no new AbilityBuff or list
+    # allocations when nothing expires, which is the common tick.
+    counts = creature.buffs_by_type
+    write = 0
+    for buff in buffs:
+        buff.remaining_ticks -= 1
+        if buff.remaining_ticks > 0:
+            buffs[write] = buff
+            write += 1
+        else:
+            counts[buff.ability_type] -= 1
+            if counts[buff.ability_type] <= 0:
+                del counts[buff.ability_type]
+                creature.buff_type_mask &= ~(1 << buff.ability_type)
+    del buffs[write:]
+    return _churn(creature)
+
+
+# -- Internal helpers ----------------------------------------------------------
+
+
+def get_chaos_strike_mod(seed: int) -> float:
+    return seeded_random(seed, 0.8, 2.2)
+
+
+def _find_trick_buff_index(creature: Creature) -> int | None:
+    """Find the index of an active Trick buff, or None."""
+    if not creature.buff_type_mask & (1 << AbilityType.TRICK):
+        return None
+    for i, buff in enumerate(creature.active_buffs):
+        if buff.ability_type == AbilityType.TRICK:
+            return i
+    return None
@@ -1,595 +1,669 @@
-"""Core types for Moreau Arena.
-
-Standalone version for the companion repository.
-"""
-
-from __future__ import annotations
-
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any
-
-
-class Animal(Enum):
-    BEAR = "bear"
-    BUFFALO = "buffalo"
-    BOAR = "boar"
-    TIGER = "tiger"
-    WOLF = "wolf"
-    MONKEY = "monkey"
-    CROCODILE = "crocodile"
-    EAGLE = "eagle"
-    SNAKE = "snake"
-    RAVEN = "raven"
-    SHARK = "shark"
-    OWL = "owl"
-    FOX = "fox"
-    SCORPION = "scorpion"
-    RHINO = "rhino"
-    PANTHER = "panther"
-    HAWK = "hawk"
-    VIPER = "viper"
-
-
-class Passive(Enum):
-    FURY_PROTOCOL = "fury_protocol"
-    THICK_HIDE = "thick_hide"
-    CHARGE = "charge"
-    AMBUSH_WIRING = "ambush_wiring"
-    PACK_SENSE = "pack_sense"
-    PRIMATE_CORTEX = "primate_cortex"
-    DEATH_ROLL = "death_roll"
-    AERIAL_STRIKE = "aerial_strike"
-    VENOM_GLANDS = "venom_glands"
-    OMEN = "omen"
-    BLOOD_FRENZY = "blood_frenzy"
-    NIGHT_VISION = "night_vision"
-    CUNNING = "cunning"
-    PARALYTIC_STING = "paralytic_sting"
-    IRON_HIDE = "iron_hide"
-    SHADOW_STALK = "shadow_stalk"
-    THERMAL_SOAR = "thermal_soar"
-    HEMOTOXIN = "hemotoxin"
-
-
-class ActiveAbilityType(Enum):
-    # Bear
-    ROAR = "roar"
-    MAUL = "maul"
-    # Buffalo
-    FORTIFY = "fortify"
-    HORN_CHARGE = "horn_charge"
-    # Tiger
-    AMBUSH = "ambush"
-    CRIPPLE = "cripple"
-    # Wolf
-    RALLY = "rally"
-    LIFE_BITE = "life_bite"
-    # Monkey
-    CONFUSE = "confuse"
-    FLING = "fling"
-    # Boar
-    TRAMPLE = "trample"
-    TUSK_GUARD = "tusk_guard"
-    # Crocodile
-    DEATH_GRIP = "death_grip"
-    SUBMERGE = "submerge"
-    # Eagle
-    SWOOP = "swoop"
-    WIND_GUST = "wind_gust"
-    # Snake
-    INJECT = "inject"
-    SHED_SKIN = "shed_skin"
-    # Raven
-    HEX = "hex"
-    SHADOW_STEP = "shadow_step"
-    # Shark
-    FEEDING_FRENZY = "feeding_frenzy"
-    THRASH = "thrash"
-    # Owl
-    PREDICT = "predict"
-    SCREECH = "screech"
-    # Fox
-    DECOY = "decoy"
-    PILFER = "pilfer"
-    # Scorpion
-    PINCH = "pinch"
-    BURROW = "burrow"
-    # Rhino
-    RHINO_HORN_CHARGE = "rhino_horn_charge"
-    RHINO_STAMPEDE = "rhino_stampede"
-    # Panther
-    PANTHER_POUNCE = "panther_pounce"
-    PANTHER_FADE = "panther_fade"
-    # Hawk
-    DIVE_BOMB = "dive_bomb"
-    HAWK_SCREECH = "hawk_screech"
-    # Viper
-    VIPER_STRIKE = "viper_strike"
-    CONSTRICT = "constrict"
-
-
-class AbilityType(Enum):
-    BERSERKER_RAGE = "berserker_rage"
-    THICK_HIDE_ABILITY = "thick_hide_ability"
-    POUNCE = "pounce"
-    HAMSTRING = "hamstring"
-    PACK_HOWL = "pack_howl"
-    REND_ABILITY = "rend_ability"
-    CHAOS_STRIKE = "chaos_strike"
-    MIMIC = "mimic"
-    STAMPEDE = "stampede"
-    IRON_WILL = "iron_will"
-    GORE = "gore"
-    LAST_STAND = "last_stand"
-    # Phase 3 — new animal abilities
-    DEATH_ROLL_ABILITY = "death_roll_ability"
-    THICK_SCALES = "thick_scales"
-    DIVE = "dive"
-    KEEN_EYE = "keen_eye"
-    VENOM = "venom"
-    COIL = "coil"
-    SHADOW_CLONE = "shadow_clone"
-    CURSE = "curse"
-    BLOOD_FRENZY_ABILITY = "blood_frenzy_ability"
-    BITE = "bite"
-    FORESIGHT = "foresight"
-    SILENT_STRIKE = "silent_strike"
-    EVASION = "evasion"
-    TRICK = "trick"
-    STING = "sting"
-    EXOSKELETON = "exoskeleton"
-    # Phase 4 — Rhino, Panther, Hawk, Viper
-    HORN_SLAM = "horn_slam"
-    RHINO_TRAMPLE = "rhino_trample"
-    SHADOW_POUNCE = "shadow_pounce"
-    FADE_OUT = "fade_out"
-    DIVE_STRIKE = "dive_strike"
-    SCREECH_DEBUFF = "screech_debuff"
-    QUICK_STRIKE = "quick_strike"
-    CONSTRICT_STUN = "constrict_stun"
-
-
-ANIMAL_PASSIVE: dict[Animal, Passive] = {
-    Animal.BEAR: Passive.FURY_PROTOCOL,
-    Animal.BUFFALO: Passive.THICK_HIDE,
-    Animal.BOAR: Passive.CHARGE,
-    Animal.TIGER: Passive.AMBUSH_WIRING,
-    Animal.WOLF: Passive.PACK_SENSE,
-    Animal.MONKEY: Passive.PRIMATE_CORTEX,
-    Animal.CROCODILE: Passive.DEATH_ROLL,
-    Animal.EAGLE: Passive.AERIAL_STRIKE,
-    Animal.SNAKE: Passive.VENOM_GLANDS,
-    Animal.RAVEN: Passive.OMEN,
-    Animal.SHARK: Passive.BLOOD_FRENZY,
-    Animal.OWL: Passive.NIGHT_VISION,
-    Animal.FOX: Passive.CUNNING,
-    Animal.SCORPION: Passive.PARALYTIC_STING,
-    Animal.RHINO: Passive.IRON_HIDE,
-    Animal.PANTHER: Passive.SHADOW_STALK,
-    Animal.HAWK: Passive.THERMAL_SOAR,
-    Animal.VIPER: Passive.HEMOTOXIN,
-}
-
-
-class MutationBranch(Enum):
-    APEX = "apex"
-    FERAL = "feral"
-
-
-class MutationTier(Enum):
-    L1 = 1
-    L2 = 2
-    L3 = 3
-
-
-@dataclass(frozen=True, order=True)
-class Position:
-    row: int
-    col: int
-
-
-@dataclass(frozen=True)
-class Size:
-    rows: int
-    cols: int
-
-
-@dataclass(frozen=True)
-class StatBlock:
-    hp: int
-    atk: int
-    spd: int
-    wil: int
-
-    def __post_init__(self) -> None:
-        for stat_name in ("hp", "atk", "spd", "wil"):
-            if getattr(self, stat_name) < 1:
-                raise ValueError(
-                    f"All stats must have min 1, got {stat_name}={getattr(self, stat_name)}"
-                )
-        total = self.hp + self.atk + self.spd + self.wil
-        if total != 20:
-            raise ValueError(f"Stats must sum to 20, got {total}")
-
-
-@dataclass(frozen=True)
-class Mutation:
-    id: str
-    name: str
-    branch: MutationBranch
-    tier: MutationTier
-    cost: int
-    success_rate: float
-    effect: str
-
-
-@dataclass
-class ActiveEffect:
-    name: str
-    remaining_ticks: int
-    damage_per_tick: int = 0
-    heal_per_tick: int = 0
-
-
-@dataclass(frozen=True)
-class Ability:
-    name: str
-    ability_type: AbilityType
-    proc_chance: float = 0.04
-    duration: int = 0
-    is_single_charge: bool = False
-    animal: Animal = Animal.BEAR
-
-
-@dataclass
-class AbilityBuff:
-    ability_type: AbilityType
-    remaining_ticks: int
-    source_side: str = "a"
-    is_mimic_copy: bool = False
-
-
-_STRONG_RATE = 0.035  # Last Stand, Berserker Rage, Gore, Mimic, Iron Will
-_OTHER_RATE = 0.045   # Pounce, Hamstring, Pack Howl, Rend, Chaos Strike, Stampede, Thick Hide
-
-ANIMAL_ABILITIES: dict[Animal, tuple[Ability, Ability]] = {
-    Animal.BEAR: (
-        Ability(
-            name="Berserker Rage",
-            ability_type=AbilityType.BERSERKER_RAGE,
-            proc_chance=_STRONG_RATE,
-            duration=3,
-            animal=Animal.BEAR,
-        ),
-        Ability(
-            name="Last Stand",
-            ability_type=AbilityType.LAST_STAND,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            is_single_charge=True,
-            animal=Animal.BEAR,
-        ),
-    ),
-    Animal.BUFFALO: (
-        Ability(
-            name="Thick Hide",
-            ability_type=AbilityType.THICK_HIDE_ABILITY,
-            proc_chance=_OTHER_RATE,
-            duration=1,
-            animal=Animal.BUFFALO,
-        ),
-        Ability(
-            name="Iron Will",
-            ability_type=AbilityType.IRON_WILL,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            is_single_charge=True,
-            animal=Animal.BUFFALO,
-        ),
-    ),
-    Animal.TIGER: (
-        Ability(
-            name="Pounce",
-            ability_type=AbilityType.POUNCE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.TIGER,
-        ),
-        Ability(
-            name="Hamstring",
-            ability_type=AbilityType.HAMSTRING,
-            proc_chance=_OTHER_RATE,
-            duration=4,
-            animal=Animal.TIGER,
-        ),
-    ),
-    Animal.WOLF: (
-        Ability(
-            name="Pack Howl",
-            ability_type=AbilityType.PACK_HOWL,
-            proc_chance=_OTHER_RATE,
-            duration=4,
-            animal=Animal.WOLF,
-        ),
-        Ability(
-            name="Rend",
-            ability_type=AbilityType.REND_ABILITY,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.WOLF,
-        ),
-    ),
-    Animal.MONKEY: (
-        Ability(
-            name="Chaos Strike",
-            ability_type=AbilityType.CHAOS_STRIKE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.MONKEY,
-        ),
-        Ability(
-            name="Mimic",
-            ability_type=AbilityType.MIMIC,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.MONKEY,
-        ),
-    ),
-    Animal.BOAR: (
-        Ability(
-            name="Stampede",
-            ability_type=AbilityType.STAMPEDE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.BOAR,
-        ),
-        Ability(
-            name="Gore",
-            ability_type=AbilityType.GORE,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.BOAR,
-        ),
-    ),
-    Animal.CROCODILE: (
-        Ability(
-            name="Death Roll",
-            ability_type=AbilityType.DEATH_ROLL_ABILITY,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.CROCODILE,
-        ),
-        Ability(
-            name="Thick Scales",
-            ability_type=AbilityType.THICK_SCALES,
-            proc_chance=_OTHER_RATE,
-            duration=2,
-            animal=Animal.CROCODILE,
-        ),
-    ),
-    Animal.EAGLE: (
-        Ability(
-            name="Dive",
-            ability_type=AbilityType.DIVE,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.EAGLE,
-        ),
-        Ability(
-            name="Keen Eye",
-            ability_type=AbilityType.KEEN_EYE,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.EAGLE,
-        ),
-    ),
-    Animal.SNAKE: (
-        Ability(
-            name="Venom",
-            ability_type=AbilityType.VENOM,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.SNAKE,
-        ),
-        Ability(
-            name="Coil",
-            ability_type=AbilityType.COIL,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.SNAKE,
-        ),
-    ),
-    Animal.RAVEN: (
-        Ability(
-            name="Shadow Clone",
-            ability_type=AbilityType.SHADOW_CLONE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            is_single_charge=True,
-            animal=Animal.RAVEN,
-        ),
-        Ability(
-            name="Curse",
-            ability_type=AbilityType.CURSE,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.RAVEN,
-        ),
-    ),
-    Animal.SHARK: (
-        Ability(
-            name="Blood Frenzy",
-            ability_type=AbilityType.BLOOD_FRENZY_ABILITY,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.SHARK,
-        ),
-        Ability(
-            name="Bite",
-            ability_type=AbilityType.BITE,
-            proc_chance=_OTHER_RATE,
-            duration=2,
-            animal=Animal.SHARK,
-        ),
-    ),
-    Animal.OWL: (
-        Ability(
-            name="Foresight",
-            ability_type=AbilityType.FORESIGHT,
-            proc_chance=_OTHER_RATE,
-            duration=2,
-            animal=Animal.OWL,
-        ),
-        Ability(
-            name="Silent Strike",
-            ability_type=AbilityType.SILENT_STRIKE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.OWL,
-        ),
-    ),
-    Animal.FOX: (
-        Ability(
-            name="Evasion",
-            ability_type=AbilityType.EVASION,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.FOX,
-        ),
-        Ability(
-            name="Trick",
-            ability_type=AbilityType.TRICK,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.FOX,
-        ),
-    ),
-    Animal.SCORPION: (
-        Ability(
-            name="Sting",
-            ability_type=AbilityType.STING,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.SCORPION,
-        ),
-        Ability(
-            name="Exoskeleton",
-            ability_type=AbilityType.EXOSKELETON,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.SCORPION,
-        ),
-    ),
-    Animal.RHINO: (
-        Ability(
-            name="Horn Slam",
-            ability_type=AbilityType.HORN_SLAM,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.RHINO,
-        ),
-        Ability(
-            name="Rhino Trample",
-            ability_type=AbilityType.RHINO_TRAMPLE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.RHINO,
-        ),
-    ),
-    Animal.PANTHER: (
-        Ability(
-            name="Shadow Pounce",
-            ability_type=AbilityType.SHADOW_POUNCE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.PANTHER,
-        ),
-        Ability(
-            name="Fade Out",
-            ability_type=AbilityType.FADE_OUT,
-            proc_chance=_OTHER_RATE,
-            duration=2,
-            animal=Animal.PANTHER,
-        ),
-    ),
-    Animal.HAWK: (
-        Ability(
-            name="Dive Strike",
-            ability_type=AbilityType.DIVE_STRIKE,
-            proc_chance=_STRONG_RATE,
-            duration=0,
-            animal=Animal.HAWK,
-        ),
-        Ability(
-            name="Screech Debuff",
-            ability_type=AbilityType.SCREECH_DEBUFF,
-            proc_chance=_OTHER_RATE,
-            duration=3,
-            animal=Animal.HAWK,
-        ),
-    ),
-    Animal.VIPER: (
-        Ability(
-            name="Quick Strike",
-            ability_type=AbilityType.QUICK_STRIKE,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.VIPER,
-        ),
-        Ability(
-            name="Constrict Stun",
-            ability_type=AbilityType.CONSTRICT_STUN,
-            proc_chance=_OTHER_RATE,
-            duration=0,
-            animal=Animal.VIPER,
-        ),
-    ),
-}
-
-
-@dataclass
-class Creature:
-    animal: Animal
-    stats: StatBlock
-    passive: Passive
-    current_hp: int
-    max_hp: int
-    base_dmg: int
-    armor_flat: int
-    size: Size
-    position: Position
-    mutations: list[Mutation] = field(default_factory=list)
-    active_effects: list[ActiveEffect] = field(default_factory=list)
-    second_wind_available: bool = False
-    second_wind_triggered: bool = False
-    charge_used: bool = False
-    first_hit_taken: bool = False
-    has_rend: bool = False
-    has_critical_strike: bool = False
-    has_execute: bool = False
-    has_regeneration: bool = False
-    has_bloodlust: bool = False
-    dodge_chance: float = 0.0
-    movement_range: int = 1
-    ability_range: int = 1
-    ability_power: float = 1.0
-    resist_chance: float = 0.0
-    abilities: tuple[Ability, ...] = ()
-    active_buffs: list[AbilityBuff] = field(default_factory=list)
-    iron_will_used: bool = False
-    last_stand_used: bool = False
-    last_ability_procced: AbilityType | None = None
-    skip_next_attack: bool = False
-    fury_triggered: bool = False
-    fury_active_ticks: int = 0
-    active_cooldowns: dict[str, int] = field(default_factory=dict)
-
-
-@dataclass
-class MatchResult:
-    winner: str | None
-    ticks: int
-    end_condition: str
-    seed: int
-    log: list[Any] = field(default_factory=list)
+"""Core types for Moreau Arena.
+
+Standalone version for the companion repository.
+"""
+
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Any
+
+
+class Animal(Enum):
+    BEAR = "bear"
+    BUFFALO = "buffalo"
+    BOAR = "boar"
+    TIGER = "tiger"
+    WOLF = "wolf"
+    MONKEY = "monkey"
+    CROCODILE = "crocodile"
+    EAGLE = "eagle"
+    SNAKE = "snake"
+    RAVEN = "raven"
+    SHARK = "shark"
+    OWL = "owl"
+    FOX = "fox"
+    SCORPION = "scorpion"
+    RHINO = "rhino"
+    PANTHER = "panther"
+    HAWK = "hawk"
+    VIPER = "viper"
+
+
+class Passive(IntEnum):
+    # IntEnum so hot-path comparisons and dict lookups use plain ints.
+    FURY_PROTOCOL = 0
+    THICK_HIDE = 1
+    CHARGE = 2
+    AMBUSH_WIRING = 3
+    PACK_SENSE = 4
+    PRIMATE_CORTEX = 5
+    DEATH_ROLL = 6
+    AERIAL_STRIKE = 7
+    VENOM_GLANDS = 8
+    OMEN = 9
+    BLOOD_FRENZY = 10
+    NIGHT_VISION = 11
+    CUNNING = 12
+    PARALYTIC_STING = 13
+    IRON_HIDE = 14
+    SHADOW_STALK = 15
+    THERMAL_SOAR = 16
+    HEMOTOXIN = 17
+
+
+class ActiveAbilityType(Enum):
+    # Bear
+    ROAR = "roar"
+    MAUL = "maul"
+    # Buffalo
+    FORTIFY = "fortify"
+    HORN_CHARGE = "horn_charge"
+    # Tiger
+    AMBUSH = "ambush"
+    CRIPPLE = "cripple"
+    # Wolf
+    RALLY = "rally"
+    LIFE_BITE = "life_bite"
+    # Monkey
+    CONFUSE = "confuse"
+    FLING = "fling"
+    # Boar
+    TRAMPLE = "trample"
+    TUSK_GUARD = "tusk_guard"
+    # Crocodile
+    DEATH_GRIP = "death_grip"
+    SUBMERGE = "submerge"
+    # Eagle
+    SWOOP = "swoop"
+    WIND_GUST = "wind_gust"
+    # Snake
+    INJECT = "inject"
+    SHED_SKIN = "shed_skin"
+    # Raven
+    HEX = "hex"
+    SHADOW_STEP = "shadow_step"
+    # Shark
+    FEEDING_FRENZY = "feeding_frenzy"
+    THRASH = "thrash"
+    # Owl
+    PREDICT = "predict"
+    SCREECH = "screech"
+    # Fox
+    DECOY = "decoy"
+    PILFER = "pilfer"
+    # Scorpion
+    PINCH = "pinch"
+    BURROW = "burrow"
+    # Rhino
+    RHINO_HORN_CHARGE = "rhino_horn_charge"
+    RHINO_STAMPEDE = "rhino_stampede"
+    # Panther
+    PANTHER_POUNCE = "panther_pounce"
+    PANTHER_FADE = "panther_fade"
+    # Hawk
+    DIVE_BOMB = "dive_bomb"
+    HAWK_SCREECH = "hawk_screech"
+    # Viper
+    VIPER_STRIKE = "viper_strike"
+    CONSTRICT = "constrict"
+
+
+class AbilityType(IntEnum):
+    # IntEnum so hot-path comparisons and dict lookups use plain ints;
+    # combat-log strings come from ABILITY_EVENT_LABELS below.
+    BERSERKER_RAGE = 0
+    THICK_HIDE_ABILITY = 1
+    POUNCE = 2
+    HAMSTRING = 3
+    PACK_HOWL = 4
+    REND_ABILITY = 5
+    CHAOS_STRIKE = 6
+    MIMIC = 7
+    STAMPEDE = 8
+    IRON_WILL = 9
+    GORE = 10
+    LAST_STAND = 11
+    # Phase 3 — new animal abilities
+    DEATH_ROLL_ABILITY = 12
+    THICK_SCALES = 13
+    DIVE = 14
+    KEEN_EYE = 15
+    VENOM = 16
+    COIL = 17
+    SHADOW_CLONE = 18
+    CURSE = 19
+    BLOOD_FRENZY_ABILITY = 20
+    BITE = 21
+    FORESIGHT = 22
+    SILENT_STRIKE = 23
+    EVASION = 24
+    TRICK = 25
+    STING = 26
+    EXOSKELETON = 27
+    # Phase 4 — Rhino, Panther, Hawk, Viper
+    HORN_SLAM = 28
+    RHINO_TRAMPLE = 29
+    SHADOW_POUNCE = 30
+    FADE_OUT = 31
+    DIVE_STRIKE = 32
+    SCREECH_DEBUFF = 33
+    QUICK_STRIKE = 34
+    CONSTRICT_STUN = 35
+
+
+# Combat logs recorded before the IntEnum conversion store the old
+# lowercase string values; replays compare against them verbatim.
+ABILITY_EVENT_LABELS: dict[AbilityType, str] = {
+    t: t.name.lower() for t in AbilityType
+}
+
+
+ANIMAL_PASSIVE: dict[Animal, Passive] = {
+    Animal.BEAR: Passive.FURY_PROTOCOL,
+    Animal.BUFFALO: Passive.THICK_HIDE,
+    Animal.BOAR: Passive.CHARGE,
+    Animal.TIGER: Passive.AMBUSH_WIRING,
+    Animal.WOLF: Passive.PACK_SENSE,
+    Animal.MONKEY: Passive.PRIMATE_CORTEX,
+    Animal.CROCODILE: Passive.DEATH_ROLL,
+    Animal.EAGLE: Passive.AERIAL_STRIKE,
+    Animal.SNAKE: Passive.VENOM_GLANDS,
+    Animal.RAVEN: Passive.OMEN,
+    Animal.SHARK: Passive.BLOOD_FRENZY,
+    Animal.OWL: Passive.NIGHT_VISION,
+    Animal.FOX: Passive.CUNNING,
+    Animal.SCORPION: Passive.PARALYTIC_STING,
+    Animal.RHINO: Passive.IRON_HIDE,
+    Animal.PANTHER: Passive.SHADOW_STALK,
+    Animal.HAWK: Passive.THERMAL_SOAR,
+    Animal.VIPER: Passive.HEMOTOXIN,
+}
+
+
+class MutationBranch(Enum):
+    APEX = "apex"
+    FERAL = "feral"
+
+
+class MutationTier(Enum):
+    L1 = 1
+    L2 = 2
+    L3 = 3
+
+
+@dataclass(frozen=True, order=True, slots=True)
+class Position:
+    row: int
+    col: int
+
+
+@dataclass(frozen=True, slots=True)
+class Size:
+    rows: int
+    cols: int
+
+
+@dataclass(frozen=True, slots=True)
+class StatBlock:
+    hp: int
+    atk: int
+    spd: int
+    wil: int
+
+    def __post_init__(self) -> None:
+        for stat_name in ("hp", "atk", "spd", "wil"):
+            if getattr(self, stat_name) < 1:
+                raise ValueError(
+                    f"All stats must have min 1, got {stat_name}={getattr(self, stat_name)}"
+                )
+        total = self.hp + self.atk + self.spd + self.wil
+        if total != 20:
+            raise ValueError(f"Stats must sum to 20, got {total}")
+
+
+@dataclass(frozen=True, slots=True)
+class Mutation:
+    id: str
+    name: str
+    branch: MutationBranch
+    tier: MutationTier
+    cost: int
+    success_rate: float
+    effect: str
+
+
+class EffectKind(IntEnum):
+    # Integer tags for over-time effects; effect identity checks in the
+    # DOT loops are int compares instead of string compares.
+    BLEED = 0
+    HEMOTOXIN = 1
+    REND = 2
+    VENOM = 3
+
+
+@dataclass(slots=True)
+class ActiveEffect:
+    kind: EffectKind
+    remaining_ticks: int
+    damage_per_tick: int = 0
+    heal_per_tick: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Ability:
+    name: str
+    ability_type: AbilityType
+    proc_chance: float = 0.04
+    duration: int = 0
+    is_single_charge: bool = False
+    animal: Animal = Animal.BEAR
+
+
+@dataclass(slots=True)
+class AbilityBuff:
+    ability_type: AbilityType
+    remaining_ticks: int
+    source_side: str = "a"
+    is_mimic_copy: bool = False
+
+
+_STRONG_RATE = 0.035  # Last Stand, Berserker Rage, Gore, Mimic, Iron Will
+_OTHER_RATE = 0.045   # Pounce, Hamstring, Pack Howl, Rend, Chaos Strike, Stampede, Thick Hide
+
+ANIMAL_ABILITIES: dict[Animal, tuple[Ability, Ability]] = {
+    Animal.BEAR: (
+        Ability(
+            name="Berserker Rage",
+            ability_type=AbilityType.BERSERKER_RAGE,
+            proc_chance=_STRONG_RATE,
+            duration=3,
+            animal=Animal.BEAR,
+        ),
+        Ability(
+            name="Last Stand",
+            ability_type=AbilityType.LAST_STAND,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            is_single_charge=True,
+            animal=Animal.BEAR,
+        ),
+    ),
+    Animal.BUFFALO: (
+        Ability(
+            name="Thick Hide",
+            ability_type=AbilityType.THICK_HIDE_ABILITY,
+            proc_chance=_OTHER_RATE,
+            duration=1,
+            animal=Animal.BUFFALO,
+        ),
+        Ability(
+            name="Iron Will",
+            ability_type=AbilityType.IRON_WILL,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            is_single_charge=True,
+            animal=Animal.BUFFALO,
+        ),
+    ),
+    Animal.TIGER: (
+        Ability(
+            name="Pounce",
+            ability_type=AbilityType.POUNCE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.TIGER,
+        ),
+        Ability(
+            name="Hamstring",
+            ability_type=AbilityType.HAMSTRING,
+            proc_chance=_OTHER_RATE,
+            duration=4,
+            animal=Animal.TIGER,
+        ),
+    ),
+    Animal.WOLF: (
+        Ability(
+            name="Pack Howl",
+            ability_type=AbilityType.PACK_HOWL,
+            proc_chance=_OTHER_RATE,
+            duration=4,
+            animal=Animal.WOLF,
+        ),
+        Ability(
+            name="Rend",
+            ability_type=AbilityType.REND_ABILITY,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.WOLF,
+        ),
+    ),
+    Animal.MONKEY: (
+        Ability(
+            name="Chaos Strike",
+            ability_type=AbilityType.CHAOS_STRIKE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.MONKEY,
+        ),
+        Ability(
+            name="Mimic",
+            ability_type=AbilityType.MIMIC,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.MONKEY,
+        ),
+    ),
+    Animal.BOAR: (
+        Ability(
+            name="Stampede",
+            ability_type=AbilityType.STAMPEDE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.BOAR,
+        ),
+        Ability(
+            name="Gore",
+            ability_type=AbilityType.GORE,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.BOAR,
+        ),
+    ),
+    Animal.CROCODILE: (
+        Ability(
+            name="Death Roll",
+            ability_type=AbilityType.DEATH_ROLL_ABILITY,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.CROCODILE,
+        ),
+        Ability(
+            name="Thick Scales",
+            ability_type=AbilityType.THICK_SCALES,
+            proc_chance=_OTHER_RATE,
+            duration=2,
+            animal=Animal.CROCODILE,
+        ),
+    ),
+    Animal.EAGLE: (
+        Ability(
+            name="Dive",
+            ability_type=AbilityType.DIVE,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.EAGLE,
+        ),
+        Ability(
+            name="Keen Eye",
+            ability_type=AbilityType.KEEN_EYE,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.EAGLE,
+        ),
+    ),
+    Animal.SNAKE: (
+        Ability(
+            name="Venom",
+            ability_type=AbilityType.VENOM,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.SNAKE,
+        ),
+        Ability(
+            name="Coil",
+            ability_type=AbilityType.COIL,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.SNAKE,
+        ),
+    ),
+    Animal.RAVEN: (
+        Ability(
+            name="Shadow Clone",
+            ability_type=AbilityType.SHADOW_CLONE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            is_single_charge=True,
+            animal=Animal.RAVEN,
+        ),
+        Ability(
+            name="Curse",
+            ability_type=AbilityType.CURSE,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.RAVEN,
+        ),
+    ),
+    Animal.SHARK: (
+        Ability(
+            name="Blood Frenzy",
+            ability_type=AbilityType.BLOOD_FRENZY_ABILITY,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.SHARK,
+        ),
+        Ability(
+            name="Bite",
+            ability_type=AbilityType.BITE,
+            proc_chance=_OTHER_RATE,
+            duration=2,
+            animal=Animal.SHARK,
+        ),
+    ),
+    Animal.OWL: (
+        Ability(
+            name="Foresight",
+            ability_type=AbilityType.FORESIGHT,
+            proc_chance=_OTHER_RATE,
+            duration=2,
+            animal=Animal.OWL,
+        ),
+        Ability(
+            name="Silent Strike",
+            ability_type=AbilityType.SILENT_STRIKE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.OWL,
+        ),
+    ),
+    Animal.FOX: (
+        Ability(
+            name="Evasion",
+            ability_type=AbilityType.EVASION,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.FOX,
+        ),
+        Ability(
+            name="Trick",
+            ability_type=AbilityType.TRICK,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.FOX,
+        ),
+    ),
+    Animal.SCORPION: (
+        Ability(
+            name="Sting",
+            ability_type=AbilityType.STING,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.SCORPION,
+        ),
+        Ability(
+            name="Exoskeleton",
+            ability_type=AbilityType.EXOSKELETON,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.SCORPION,
+        ),
+    ),
+    Animal.RHINO: (
+        Ability(
+            name="Horn Slam",
+            ability_type=AbilityType.HORN_SLAM,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.RHINO,
+        ),
+        Ability(
+            name="Rhino Trample",
+            ability_type=AbilityType.RHINO_TRAMPLE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.RHINO,
+        ),
+    ),
+    Animal.PANTHER: (
+        Ability(
+            name="Shadow Pounce",
+            ability_type=AbilityType.SHADOW_POUNCE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.PANTHER,
+        ),
+        Ability(
+            name="Fade Out",
+            ability_type=AbilityType.FADE_OUT,
+            proc_chance=_OTHER_RATE,
+            duration=2,
+            animal=Animal.PANTHER,
+        ),
+    ),
+    Animal.HAWK: (
+        Ability(
+            name="Dive Strike",
+            ability_type=AbilityType.DIVE_STRIKE,
+            proc_chance=_STRONG_RATE,
+            duration=0,
+            animal=Animal.HAWK,
+        ),
+        Ability(
+            name="Screech Debuff",
+            ability_type=AbilityType.SCREECH_DEBUFF,
+            proc_chance=_OTHER_RATE,
+            duration=3,
+            animal=Animal.HAWK,
+        ),
+    ),
+    Animal.VIPER: (
+        Ability(
+            name="Quick Strike",
+            ability_type=AbilityType.QUICK_STRIKE,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.VIPER,
+        ),
+        Ability(
+            name="Constrict Stun",
+            ability_type=AbilityType.CONSTRICT_STUN,
+            proc_chance=_OTHER_RATE,
+            duration=0,
+            animal=Animal.VIPER,
+        ),
+    ),
+}
+
+
+@dataclass(slots=True)
+class Creature:
+    animal: Animal
+    stats: StatBlock
+    passive: Passive
+    current_hp: int
+    max_hp: int
+    base_dmg: int
+    armor_flat: int
+    size: Size
+    position: Position
+    mutations: list[Mutation] = field(default_factory=list)
+    active_effects: list[ActiveEffect] = field(default_factory=list)
+    second_wind_available: bool = False
+    second_wind_triggered: bool = False
+    charge_used: bool = False
+    first_hit_taken: bool = False
+    has_rend: bool = False
+    has_critical_strike: bool = False
+    has_execute: bool = False
+    has_regeneration: bool = False
+    has_bloodlust: bool = False
+    dodge_chance: float = 0.0
+    movement_range: int = 1
+    ability_range: int = 1
+    ability_power: float = 1.0
+    resist_chance: float = 0.0
+    abilities: tuple[Ability, ...] = ()
+    active_buffs: list[AbilityBuff] = field(default_factory=list)
+    # Per-type refcount of active_buffs, kept in sync by the ability
+    # system so buff-presence queries are dict lookups, not list scans.
+    buffs_by_type: dict[AbilityType, int] = field(default_factory=dict)
+    # Bitmask over AbilityType values mirroring buffs_by_type's keys;
+    # set-membership tests against fixed ability groups become one
+    # AND against a constant mask.
+    buff_type_mask: int = 0
+    # Count of active ability_venom effects, kept in sync by the venom
+    # proc and the engine's DOT expiry so the 3-stack cap check does
+    # not scan active_effects.
+    venom_stacks: int = 0
+    iron_will_used: bool = False
+    last_stand_used: bool = False
+    last_ability_procced: AbilityType | None = None
+    skip_next_attack: bool = False
+    fury_triggered: bool = False
+    fury_active_ticks: int = 0
+    active_cooldowns: dict[str, int] = field(default_factory=dict)
+    # HP thresholds derived from max_hp, which never changes mid-match.
+    # Floats keep the exact comparison semantics of the inline
+    # expressions they replace; the healing/DOT amounts were already
+    # floored to ints.
+    hp_15pct: float = field(init=False)
+    hp_25pct: float = field(init=False)
+    hp_50pct: float = field(init=False)
+    iron_will_heal: int = field(init=False)
+    rend_dot_dmg: int = field(init=False)
+    venom_dot_dmg: int = field(init=False)
+    ring_tick_dmg: int = field(init=False)
+    # Whether the ability list contains the two single-charge abilities;
+    # lets the proc loop skip its charge bookkeeping for the many
+    # creatures that have neither.
+    has_iron_will: bool = field(init=False)
+    has_last_stand: bool = field(init=False)
+
+    def __copy__(self) -> "Creature":
+        # The engine shallow-copies a creature on every state change to
+        # give the grid a fresh identity. A direct slot-for-slot copy
+        # skips both __init__/__post_init__ (dataclasses.replace) and
+        # the generic __reduce_ex__ protocol (default copy.copy), which
+        # dominate on a combat-hot class this wide.
+        clone = object.__new__(Creature)
+        for slot in self.__slots__:
+            setattr(clone, slot, getattr(self, slot))
+        return clone
+
+    def __post_init__(self) -> None:
+        self.hp_15pct = self.max_hp * 0.15
+        self.hp_25pct = self.max_hp * 0.25
+        self.hp_50pct = self.max_hp * 0.5
+        self.iron_will_heal = math.floor(self.max_hp * 0.12)
+        self.rend_dot_dmg = max(1, math.floor(self.max_hp * 0.05))
+        self.venom_dot_dmg = max(1, math.floor(self.max_hp * 0.03))
+        self.ring_tick_dmg = max(1, math.floor(self.max_hp * 0.02))
+        self.has_iron_will = any(
+            a.ability_type == AbilityType.IRON_WILL for a in self.abilities
+        )
+        self.has_last_stand = any(
+            a.ability_type == AbilityType.LAST_STAND for a in self.abilities
+        )
+
+
+@dataclass(slots=True)
+class MatchResult:
+    winner: str | None
+    ticks: int
+    end_condition: str
+    seed: int
+    log: list[Any] = field(default_factory=list)
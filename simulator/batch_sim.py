@@ -0,0 +1,82 @@
+"""Batched Monte-Carlo match driver.
+
+Standalone version for the companion repository.
+
+Runs large numbers of independent matches for balance studies. The
+parallel axis is the match, not the tick: per-tick state (buffs, procs,
+grid occupancy) is driven by the SHA-256 seed chain in simulator/seed.py
+whose outputs the recorded tournament logs pin bit-for-bit, so a
+vectorized SoA tick kernel cannot be made equivalent to the reference
+engine. Matches, however, are fully independent and deterministic per
+seed, so fanning them across processes scales linearly without touching
+combat behavior.
+
+There is deliberately no JIT stage here, so there is also no compile
+cache to warm at process start: worker startup cost is plain module
+import, and on fork-based platforms the templates and caches built at
+import time are shared with workers for free.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import Sequence
+
+from simulator.animals import Creature
+from simulator.engine import CombatConfig, CombatEngine
+
+# One engine per worker process; CombatEngine is stateless between runs.
+_ENGINE = CombatEngine()
+
+
+def _run_one(
+    task: tuple[Creature, Creature, int],
+) -> tuple[str | None, int]:
+    """Run one match in a worker. Top-level so it pickles for Pool workers."""
+    creature_a, creature_b, seed = task
+    result = _ENGINE.run_combat(creature_a, creature_b, seed)
+    return result.winner, result.ticks
+
+
+def run_batch(
+    tasks: Sequence[tuple[Creature, Creature, int]],
+    processes: int | None = None,
+) -> list[tuple[str | None, int]]:
+    """Run a batch of matches in parallel, preserving task order.
+
+    Each task is (creature_a, creature_b, match_seed); the return is the
+    (winner, ticks) summary per task. Results are identical to running
+    the same seeds serially through CombatEngine — only wall-clock time
+    changes. Full logs are deliberately not returned: they dominate IPC
+    cost, and any single match can be re-run from its seed.
+    """
+    if not tasks:
+        return []
+    n_procs = processes or os.cpu_count() or 1
+    if n_procs == 1 or len(tasks) == 1:
+        return [_run_one(task) for task in tasks]
+    chunksize = max(1, len(tasks) // (n_procs * 4))
+    with multiprocessing.Pool(processes=n_procs) as pool:
+        return pool.map(_run_one, tasks, chunksize=chunksize)
+
+
+def run_tournament(
+    match_seeds: Sequence[int],
+    creatures_a: Sequence[Creature],
+    creatures_b: Sequence[Creature],
+    processes: int | None = None,
+) -> list[tuple[str | None, int]]:
+    """Run N independent matches given parallel sequences of inputs.
+
+    Columnar counterpart to run_batch for callers that already hold
+    seeds and rosters as separate sequences (tournament scripts do).
+    Scaling is near-linear in physical cores since matches share nothing
+    but the engine rules.
+    """
+    if not len(match_seeds) == len(creatures_a) == len(creatures_b):
+        raise ValueError(
+            "match_seeds, creatures_a and creatures_b must be the same length"
+        )
+    tasks = list(zip(creatures_a, creatures_b, match_seeds))
+    return run_batch(tasks, processes=processes)
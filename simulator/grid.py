@@ -1,21 +1,71 @@
 """8x8 grid and movement logic.
 
 Standalone version for the companion repository.
+
+Internally the board and the movement scans work on flat integer
+indexes (row * width + col); Position objects only appear at the API
+boundary -- creature placement, returned moves, and the helper methods
+nothing in the combat path calls. Replacing Position itself with a
+packed int would not remove any hot-path allocations beyond that, so
+the dataclass stays as the public coordinate type.
 """
 
 from __future__ import annotations
 
 import dataclasses
+import functools
 
 from simulator.animals import Creature, Position, Size
-from simulator.seed import seeded_random
+from simulator.seed import seeded_int
+
+# Candidate move offsets per movement range, minus (0, 0). Every offset
+# in the (2r+1)^2 square is already within Chebyshev range r, so the
+# pathfinding scan needs no per-candidate distance check. Ranges are
+# small fixed stats, so the cache stays tiny.
+_OFFSETS_BY_RANGE: dict[int, list[tuple[int, int]]] = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _footprint_indexes(
+    row: int, col: int, rows: int, cols: int, width: int
+) -> tuple[int, ...]:
+    """Flat board indexes covered by a footprint at (row, col).
+
+    Creatures sit at the same (position, size) for many ticks, so the
+    key space is tiny and the cache turns repeated footprint walks into
+    one dict hit.
+    """
+    base = row * width + col
+    return tuple(
+        base + dr * width + dc
+        for dr in range(rows)
+        for dc in range(cols)
+    )
+
+
+def _movement_offsets(movement_range: int) -> list[tuple[int, int]]:
+    offsets = _OFFSETS_BY_RANGE.get(movement_range)
+    if offsets is None:
+        offsets = [
+            (dr, dc)
+            for dr in range(-movement_range, movement_range + 1)
+            for dc in range(-movement_range, movement_range + 1)
+            if dr or dc
+        ]
+        _OFFSETS_BY_RANGE[movement_range] = offsets
+    return offsets
 
 
 class Grid:
     def __init__(self, width: int = 8, height: int = 8) -> None:
         self.width = width
         self.height = height
-        self._cells: dict[Position, Creature] = {}
+        # Flat row-major board (index row*width+col). Slots hold creature
+        # references, not ids: occupancy checks compare by identity, and
+        # that identity contract is what the engine's copy-on-change
+        # creature handling relies on. A flat list keeps it while
+        # dropping the Position hashing the old dict paid on every probe.
+        self._cells: list[Creature | None] = [None] * (width * height)
 
     def is_valid_position(self, position: Position, size: Size) -> bool:
         if position.row < 0 or position.col < 0:
@@ -33,26 +83,38 @@ class Grid:
                 cells.append(Position(position.row + dr, position.col + dc))
         return cells
 
+    def _occupied_indexes(self, position: Position, size: Size) -> tuple[int, ...]:
+        return _footprint_indexes(
+            position.row, position.col, size.rows, size.cols, self.width
+        )
+
     def place_creature(self, creature: Creature) -> None:
         if not self.is_valid_position(creature.position, creature.size):
             raise ValueError(
                 f"Position {creature.position} invalid for size {creature.size}"
             )
-        cells = self.get_occupied_cells(creature.position, creature.size)
-        for cell in cells:
-            if cell in self._cells and self._cells[cell] is not creature:
-                raise ValueError(f"Cell {cell} already occupied")
-        for cell in cells:
-            self._cells[cell] = creature
+        cells = self._cells
+        indexes = self._occupied_indexes(creature.position, creature.size)
+        for idx in indexes:
+            occupant = cells[idx]
+            if occupant is not None and occupant is not creature:
+                row, col = divmod(idx, self.width)
+                raise ValueError(
+                    f"Cell {Position(row, col)} already occupied"
+                )
+        for idx in indexes:
+            cells[idx] = creature
 
     def remove_creature(self, creature: Creature) -> None:
-        cells = self.get_occupied_cells(creature.position, creature.size)
-        for cell in cells:
-            if cell in self._cells and self._cells[cell] is creature:
-                del self._cells[cell]
+        cells = self._cells
+        for idx in self._occupied_indexes(creature.position, creature.size):
+            if cells[idx] is creature:
+                cells[idx] = None
 
     def get_creature_at(self, position: Position) -> Creature | None:
-        return self._cells.get(position)
+        if not (0 <= position.row < self.height and 0 <= position.col < self.width):
+            return None
+        return self._cells[position.row * self.width + position.col]
 
     def move_creature(self, creature: Creature, target: Position) -> Creature:
         dist = self.get_distance(creature.position, target)
@@ -63,11 +125,13 @@ class Grid:
             )
         if not self.is_valid_position(target, creature.size):
             raise ValueError(f"Target {target} invalid for size {creature.size}")
-        target_cells = self.get_occupied_cells(target, creature.size)
-        for cell in target_cells:
-            occupant = self._cells.get(cell)
+        for idx in self._occupied_indexes(target, creature.size):
+            occupant = self._cells[idx]
             if occupant is not None and occupant is not creature:
-                raise ValueError(f"Target cell {cell} occupied by another creature")
+                row, col = divmod(idx, self.width)
+                raise ValueError(
+                    f"Target cell {Position(row, col)} occupied by another creature"
+                )
         self.remove_creature(creature)
         moved = dataclasses.replace(creature, position=target)
         self.place_creature(moved)
@@ -99,66 +163,88 @@ class Grid:
     ) -> bool:
         if not self.is_valid_position(pos, size):
             return False
-        for cell in self.get_occupied_cells(pos, size):
-            occupant = self._cells.get(cell)
+        cells = self._cells
+        for idx in self._occupied_indexes(pos, size):
+            occupant = cells[idx]
             if occupant is not None and occupant is not exclude:
                 return False
         return True
 
     def find_path_toward(self, creature: Creature, target: Position) -> Position:
-        best_pos = creature.position
-        best_dist = self.get_distance(creature.position, target)
-        for dr in range(-creature.movement_range, creature.movement_range + 1):
-            for dc in range(-creature.movement_range, creature.movement_range + 1):
-                if dr == 0 and dc == 0:
-                    continue
-                candidate = Position(
-                    creature.position.row + dr, creature.position.col + dc
-                )
-                move_dist = self.get_distance(creature.position, candidate)
-                if move_dist > creature.movement_range:
-                    continue
-                if not self._is_position_free(
-                    candidate, creature.size, exclude=creature
-                ):
-                    continue
-                dist_to_target = self.get_distance(candidate, target)
-                if dist_to_target < best_dist:
-                    best_dist = dist_to_target
-                    best_pos = candidate
-                elif dist_to_target == best_dist and candidate < best_pos:
-                    best_pos = candidate
-        return best_pos
+        pos = creature.position
+        rows, cols = creature.size.rows, creature.size.cols
+        width, height = self.width, self.height
+        cells = self._cells
+        t_row, t_col = target.row, target.col
+        best_row, best_col = pos.row, pos.col
+        best_dist = max(abs(best_row - t_row), abs(best_col - t_col))
+        for dr, dc in _movement_offsets(creature.movement_range):
+            row = pos.row + dr
+            col = pos.col + dc
+            if row < 0 or col < 0 or row + rows > height or col + cols > width:
+                continue
+            base = row * width + col
+            free = True
+            for fr in range(rows):
+                row_base = base + fr * width
+                for fc in range(cols):
+                    occupant = cells[row_base + fc]
+                    if occupant is not None and occupant is not creature:
+                        free = False
+                        break
+                if not free:
+                    break
+            if not free:
+                continue
+            dist_to_target = max(abs(row - t_row), abs(col - t_col))
+            if dist_to_target < best_dist:
+                best_dist = dist_to_target
+                best_row, best_col = row, col
+            elif dist_to_target == best_dist and (row, col) < (best_row, best_col):
+                best_row, best_col = row, col
+        if best_row == pos.row and best_col == pos.col:
+            return pos
+        return Position(best_row, best_col)
 
     def find_path_away(self, creature: Creature, enemy_pos: Position) -> Position:
-        best_pos = creature.position
-        best_dist = self.get_distance(creature.position, enemy_pos)
-        for dr in range(-creature.movement_range, creature.movement_range + 1):
-            for dc in range(-creature.movement_range, creature.movement_range + 1):
-                if dr == 0 and dc == 0:
-                    continue
-                candidate = Position(
-                    creature.position.row + dr, creature.position.col + dc
-                )
-                move_dist = self.get_distance(creature.position, candidate)
-                if move_dist > creature.movement_range:
-                    continue
-                if not self._is_position_free(
-                    candidate, creature.size, exclude=creature
-                ):
-                    continue
-                dist_to_enemy = self.get_distance(candidate, enemy_pos)
-                if dist_to_enemy > best_dist:
-                    best_dist = dist_to_enemy
-                    best_pos = candidate
-                elif dist_to_enemy == best_dist and candidate < best_pos:
-                    best_pos = candidate
-        return best_pos
+        pos = creature.position
+        rows, cols = creature.size.rows, creature.size.cols
+        width, height = self.width, self.height
+        cells = self._cells
+        e_row, e_col = enemy_pos.row, enemy_pos.col
+        best_row, best_col = pos.row, pos.col
+        best_dist = max(abs(best_row - e_row), abs(best_col - e_col))
+        for dr, dc in _movement_offsets(creature.movement_range):
+            row = pos.row + dr
+            col = pos.col + dc
+            if row < 0 or col < 0 or row + rows > height or col + cols > width:
+                continue
+            base = row * width + col
+            free = True
+            for fr in range(rows):
+                row_base = base + fr * width
+                for fc in range(cols):
+                    occupant = cells[row_base + fc]
+                    if occupant is not None and occupant is not creature:
+                        free = False
+                        break
+                if not free:
+                    break
+            if not free:
+                continue
+            dist_to_enemy = max(abs(row - e_row), abs(col - e_col))
+            if dist_to_enemy > best_dist:
+                best_dist = dist_to_enemy
+                best_row, best_col = row, col
+            elif dist_to_enemy == best_dist and (row, col) < (best_row, best_col):
+                best_row, best_col = row, col
+        if best_row == pos.row and best_col == pos.col:
+            return pos
+        return Position(best_row, best_col)
 
     def generate_starting_position(self, side: str, size: Size, seed: int) -> Position:
         max_col = self.width - size.cols
-        col_f = seeded_random(seed, 0.0, max_col + 0.999)
-        col = int(col_f)
+        col = seeded_int(seed, max_col)
         col = max(0, min(col, max_col))
         if side == "a":
             max_row = min(1, self.height - size.rows)
@@ -2,24 +2,57 @@
 
 All random events must use these functions. Never use random.random() directly.
 Seed chain: match_seed -> tick_seed -> hit_seed -> seeded_random()
+
+SHA-256 is load-bearing here, not a style choice: every recorded
+tournament outcome is a function of these exact digest values, so a
+cheaper mixer (SplitMix64, xxhash) would replay none of the published
+data. Swapping the hash means regenerating and re-verifying all
+tournament JSONL under a new engine version.
+
+There is also no faster SHA-256 to call: hashlib's sha256 is already
+OpenSSL's C implementation behind a thin method, and routing the same
+EVP call through ctypes adds foreign-function overhead per invocation
+instead of removing any. The wins available at this layer are the
+precompiled packers and fused helpers below, which cut the Python
+frames around the hash rather than the hash itself.
 """
 
 import hashlib
 import struct
 
+# Precompiled packers: struct.Struct skips the per-call format-string
+# lookup that module-level struct.pack pays in these hash-bound helpers.
+_PACK_TICK = struct.Struct(">QI").pack
+_PACK_HIT = struct.Struct(">QII").pack
+_PACK_PROC = struct.Struct(">QIBB").pack
+_PACK_U32 = struct.Struct(">I").pack
+_UNPACK_U32 = struct.Struct(">I").unpack
+_UNPACK_U64 = struct.Struct(">Q").unpack
+
+_sha256 = hashlib.sha256
+
 
 def derive_tick_seed(match_seed: int, tick_index: int) -> int:
     """Derive a tick-specific seed from match seed and tick index."""
-    data = struct.pack(">QI", match_seed, tick_index)
-    h = hashlib.sha256(data).digest()
-    return struct.unpack(">I", h[:4])[0]
+    h = _sha256(_PACK_TICK(match_seed, tick_index)).digest()
+    return _UNPACK_U32(h[:4])[0]
 
 
 def derive_hit_seed(match_seed: int, tick_index: int, attack_index: int) -> int:
     """Derive a hit-specific seed from match seed, tick, and attack index."""
-    data = struct.pack(">QII", match_seed, tick_index, attack_index)
-    h = hashlib.sha256(data).digest()
-    return struct.unpack(">I", h[:4])[0]
+    h = _sha256(_PACK_HIT(match_seed, tick_index, attack_index)).digest()
+    return _UNPACK_U32(h[:4])[0]
+
+
+def _seed_to_unit(seed: int) -> float:
+    """Map a seed to a uniform float in [0, 1).
+
+    Shared core of seeded_random / seeded_bool / proc_roll: one SHA-256
+    over the masked uint32 seed, first 8 digest bytes normalized.
+    """
+    # Mask to uint32 to handle arithmetic overflow from callers
+    h = _sha256(_PACK_U32(seed & 0xFFFFFFFF)).digest()
+    return _UNPACK_U64(h[:8])[0] / (2**64)
 
 
 def seeded_random(seed: int, min_val: float = 0.0, max_val: float = 1.0) -> float:
@@ -27,19 +60,24 @@ def seeded_random(seed: int, min_val: float = 0.0, max_val: float = 1.0) -> floa
 
     Uses seed to produce a uniform float, then scales to range.
     """
-    # Mask to uint32 to handle arithmetic overflow from callers
-    seed = seed & 0xFFFFFFFF
-    data = struct.pack(">I", seed)
-    h = hashlib.sha256(data).digest()
-    # Convert first 8 bytes to uint64, normalize to [0, 1)
-    raw = struct.unpack(">Q", h[:8])[0]
-    normalized = raw / (2**64)
-    return min_val + normalized * (max_val - min_val)
+    return min_val + _seed_to_unit(seed) * (max_val - min_val)
 
 
 def seeded_bool(seed: int, probability: float) -> bool:
     """Return True with given probability, deterministically from seed."""
-    return seeded_random(seed) < probability
+    return _seed_to_unit(seed) < probability
+
+
+def seeded_int(seed: int, max_val: int) -> int:
+    """Deterministic integer in [0, max_val] from a seed.
+
+    Floors the same float expression starting positions have always
+    used (unit * (max_val + 0.999)), rather than reducing the digest
+    modulo the range: an integer reduction would be cleaner but yields
+    different values for the same seeds, which would move every
+    recorded starting position.
+    """
+    return int(_seed_to_unit(seed) * (max_val + 0.999))
 
 
 def derive_proc_seed(
@@ -53,6 +91,26 @@ def derive_proc_seed(
     Uses SHA-256 with packed (match_seed:u64, tick_index:u32,
     creature_index:u8, ability_index:u8).
     """
-    data = struct.pack(">QIBB", match_seed, tick_index, creature_index, ability_index)
-    h = hashlib.sha256(data).digest()
-    return struct.unpack(">I", h[:4])[0]
+    data = _PACK_PROC(match_seed, tick_index, creature_index, ability_index)
+    h = _sha256(data).digest()
+    return _UNPACK_U32(h[:4])[0]
+
+
+def proc_roll(
+    match_seed: int,
+    tick_index: int,
+    creature_index: int,
+    ability_index: int,
+    probability: float,
+) -> tuple[int, bool]:
+    """Derive a proc seed and roll it against a probability in one call.
+
+    Output-identical to derive_proc_seed followed by seeded_bool, fused
+    so the engine's hottest loop pays one interpreter frame per ability
+    instead of three. Returns (proc_seed, passed) since callers chain
+    further rolls off the proc seed.
+    """
+    data = _PACK_PROC(match_seed, tick_index, creature_index, ability_index)
+    seed = _UNPACK_U32(_sha256(data).digest()[:4])[0]
+    h = _sha256(_PACK_U32(seed)).digest()
+    return seed, _UNPACK_U64(h[:8])[0] / (2**64) < probability
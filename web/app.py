@@ -7,14 +7,19 @@ the benchmark methodology.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import math
+import mmap
 import os
 import random
 import re
+import concurrent.futures
+import functools
 import secrets
 import sys
+import threading
 from collections import Counter, defaultdict
 from contextlib import asynccontextmanager
 from itertools import combinations
@@ -25,9 +30,35 @@ import time
 
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# JSONL record decoding: orjson when available (C parser, ~5x faster on
+# the small result records), stdlib otherwise. Both raise ValueError
+# subclasses on bad lines.
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+if HAS_ORJSON:
+    _json_dumps_bytes = orjson.dumps
+else:
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
 # Add parent directory to sys.path so we can import the simulator package
 _project_root = Path(__file__).resolve().parent.parent
@@ -70,6 +101,12 @@ from part_b_state import (
 )
 from simulator.__main__ import _create_creature, _parse_build, _run_games
 from simulator.engine import CombatEngine
+
+# Build strings repeat heavily -- the reference builds on every
+# challenge, plus re-submitted fight forms -- and the parse is a pure
+# function returning an immutable tuple, so cache it at the import
+# boundary. Errors propagate uncached, so invalid builds still raise.
+_parse_build = functools.lru_cache(maxsize=1024)(_parse_build)
 from season1.engine_s1 import run_match as s1_run_match
 from pets.soul import generate_soul_response, calculate_mood as pet_calculate_mood
 
@@ -137,9 +174,60 @@ REFERENCE_BUILDS = [
     "scorpion 5 5 5 5",
 ]
 
+# Parsed once at import: the strings above are fixed, and a bad one
+# should fail the deploy here, not a challenge request later.
+_PARSED_REFERENCE_BUILDS: dict[str, tuple[Any, int, int, int, int]] = {
+    ref_build: _parse_build(ref_build) for ref_build in REFERENCE_BUILDS
+}
+
 
 BASELINES = {"SmartAgent", "GreedyAgent", "ConservativeAgent", "HighVarianceAgent", "RandomAgent"}
 
+# Process pool for CPU-bound simulation work. Created lazily so
+# importing the app (tests, tooling) doesn't fork workers; sized for
+# the challenge fan-out, which is the widest consumer.
+_SIM_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+_SIM_POOL_LOCK = threading.Lock()
+
+
+def _get_sim_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _SIM_POOL
+    if _SIM_POOL is None:
+        with _SIM_POOL_LOCK:
+            if _SIM_POOL is None:
+                _SIM_POOL = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=min(len(REFERENCE_BUILDS), os.cpu_count() or 1)
+                )
+    return _SIM_POOL
+
+
+# Simulations are deterministic in their full argument tuple, so a
+# repeated pairing is a dict hit instead of a pool run. The cache lives
+# in the parent process and dies with it, which also makes simulator
+# deploys a natural invalidation point.
+_SIM_CACHE: dict[tuple, dict[str, Any]] = {}
+_SIM_CACHE_MAX = 1024
+
+
+def _sim_cache_put(key: tuple, res: dict[str, Any]) -> None:
+    if len(_SIM_CACHE) >= _SIM_CACHE_MAX:
+        _SIM_CACHE.pop(next(iter(_SIM_CACHE)))
+    _SIM_CACHE[key] = res
+
+
+def _challenge_worker(
+    challenger: tuple[Any, int, int, int, int], ref_build: str, games: int
+) -> dict[str, Any]:
+    """Run one reference pairing in a pool worker. Top-level so it pickles."""
+    animal_r, hp_r, atk_r, spd_r, wil_r = _PARSED_REFERENCE_BUILDS.get(
+        ref_build
+    ) or _parse_build(ref_build)
+    return _run_games(
+        *challenger,
+        animal_r, hp_r, atk_r, spd_r, wil_r,
+        games, base_seed=42,
+    )
+
 
 def _require_self_lab_enabled() -> None:
     if not SELF_LAB_PUBLIC_ENABLED:
@@ -310,8 +398,8 @@ def _compute_agent_cards() -> dict[str, dict[str, Any]]:
                 if not line:
                     continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    record = _json_loads(line)
+                except ValueError:
                     continue
 
                 agent_a = record.get("agent_a", "unknown")
@@ -562,8 +650,8 @@ def _compute_agent_builds() -> dict[str, dict[str, Any]]:
                 if not line:
                     continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    record = _json_loads(line)
+                except ValueError:
                     continue
 
                 agent_a = record.get("agent_a", "unknown")
@@ -1041,14 +1129,42 @@ def _precompute_cache() -> None:
     logger.info("Cache precomputed for tracks: %s", list(_cache.keys()))
 
 
+async def _warm_services() -> None:
+    """Prime the simulation pool and leaderboard caches before traffic.
+
+    The first fight after boot otherwise pays worker spawn and module
+    import, and the first leaderboard hit pays the full corpus parse;
+    both show up as a p99 spike right after every deploy. A failed
+    warmup only forfeits that head start, so it must never take
+    startup down with it.
+    """
+    try:
+        _load_leaderboard()
+        challenger = _parse_build("bear 5 5 5 5")
+        opponent = _parse_build("wolf 6 6 5 3")
+        await asyncio.get_running_loop().run_in_executor(
+            _get_sim_pool(), _run_games, *challenger, *opponent, 1, 42,
+        )
+    except Exception:
+        logger.warning("Startup warmup failed", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Precompute leaderboard data at startup."""
+    """Precompute leaderboard data and warm worker processes at startup."""
     _precompute_cache()
+    await _warm_services()
     yield
 
 
-app = FastAPI(title="Moreau Arena", version="2.0.0", lifespan=lifespan)
+# orjson encodes response models and dict payloads several times faster
+# than stdlib json; fall back to the default JSONResponse without it.
+app = FastAPI(
+    title="Moreau Arena",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+)
 
 
 @app.middleware("http")
@@ -1067,21 +1183,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (leaderboard, match logs) for clients that
+# accept it; small responses skip the deflate overhead.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 class FightRequest(BaseModel):
-    build1: str = Field(..., description='Build string, e.g. "bear 3 14 2 1"')
-    build2: str = Field(..., description='Build string, e.g. "buffalo 8 6 4 2"')
+    # Strip and non-empty checks run inside pydantic-core rather than a
+    # Python-level validator frame per field.
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    build1: str = Field(..., min_length=1, description='Build string, e.g. "bear 3 14 2 1"')
+    build2: str = Field(..., min_length=1, description='Build string, e.g. "buffalo 8 6 4 2"')
     games: int = Field(default=100, ge=1, le=10000)
     seed: int | None = Field(default=None, ge=0, le=2_147_483_647)
 
-    @field_validator("build1", "build2")
-    @classmethod
-    def validate_build_string(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("Build string cannot be empty")
-        return v
-
 
 class FightResponse(BaseModel):
     build1_wins: int
@@ -1091,16 +1207,10 @@ class FightResponse(BaseModel):
 
 
 class ChallengeRequest(BaseModel):
-    build: str = Field(..., description='Build string, e.g. "bear 3 14 2 1"')
-    games: int = Field(default=100, ge=1, le=10000)
+    model_config = ConfigDict(str_strip_whitespace=True)
 
-    @field_validator("build")
-    @classmethod
-    def validate_build_string(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("Build string cannot be empty")
-        return v
+    build: str = Field(..., min_length=1, description='Build string, e.g. "bear 3 14 2 1"')
+    games: int = Field(default=100, ge=1, le=10000)
 
 
 class ChallengeResult(BaseModel):
@@ -1148,14 +1258,6 @@ class PlayResponse(BaseModel):
     games: list[PlayGameResult]
 
 
-class LeaderboardEntry(BaseModel):
-    agent: str
-    series_wins: int
-    series_losses: int
-    series_draws: int
-    win_rate: float
-
-
 class StrategyRequest(BaseModel):
     strategy: str = Field(..., description='Natural language strategy, e.g. "fastest" or "glass cannon"')
     games: int = Field(default=100, ge=1, le=1000)
@@ -1195,7 +1297,7 @@ class StrategyResponse(BaseModel):
 # -- Shared logic ----------------------------------------------------------------
 
 
-def _fight_logic(build1: str, build2: str, games: int) -> FightResponse:
+async def _fight_logic(build1: str, build2: str, games: int) -> FightResponse:
     try:
         animal_a, hp_a, atk_a, spd_a, wil_a = _parse_build(build1)
     except ValueError as e:
@@ -1206,14 +1308,20 @@ def _fight_logic(build1: str, build2: str, games: int) -> FightResponse:
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid build2: {e}")
 
-    try:
-        result = _run_games(
-            animal_a, hp_a, atk_a, spd_a, wil_a,
-            animal_b, hp_b, atk_b, spd_b, wil_b,
-            games, base_seed=42,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Simulation error: {e}")
+    key = (
+        animal_a, hp_a, atk_a, spd_a, wil_a,
+        animal_b, hp_b, atk_b, spd_b, wil_b,
+        games, 42,
+    )
+    result = _SIM_CACHE.get(key)
+    if result is None:
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                _get_sim_pool(), _run_games, *key,
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Simulation error: {e}")
+        _sim_cache_put(key, result)
 
     return FightResponse(
         build1_wins=result["wins_a"],
@@ -1223,62 +1331,182 @@ def _fight_logic(build1: str, build2: str, games: int) -> FightResponse:
     )
 
 
-def _load_leaderboard() -> list[dict[str, Any]]:
-    """Read all JSONL files in results/ and aggregate series wins per agent."""
-    if not RESULTS_DIR.exists():
-        return []
-
-    agent_stats: dict[str, dict[str, int]] = {}
-
-    for jsonl_path in RESULTS_DIR.glob("*.jsonl"):
-        with open(jsonl_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+# Leaderboard aggregation cache: (per-file stat signature, entries,
+# serialized JSON body). Endpoint handlers run in FastAPI's threadpool,
+# so the cache swap is guarded; readers take a local reference before
+# comparing.
+_LB_LOCK = threading.Lock()
+_LB_CACHE: (
+    tuple[tuple[tuple[str, int, int], ...], list[dict[str, Any]], bytes] | None
+) = None
+# Per-file partial aggregates keyed on (mtime_ns, size): appending a new
+# tournament file only parses that file, not the whole corpus.
+_LB_FILE_CACHE: dict[Path, tuple[tuple[int, int], dict[str, list[int]]]] = {}
+# Cache misses above this count fan out to the worker pool instead of
+# parsing serially; below it the pickling overhead outweighs the overlap.
+_LB_PARALLEL_MIN = 8
+
+
+def _aggregate_results_file(jsonl_path: Path) -> dict[str, list[int]]:
+    """Per-agent [wins, losses, draws] counters for one results file.
+
+    Compact positional counters instead of keyed dicts: each update is
+    an integer index, not a string hash, and the per-file cache holds
+    three ints per agent. Labels are attached once when the leaderboard
+    entries are built.
+
+    This stays pure Python on purpose. An AOT-compiled variant (mypyc,
+    Cython) would need a build stage the deploy path doesn't have --
+    the Docker image pip-installs requirements onto python:slim with no
+    compiler -- and the per-file cache plus pool fan-out already keep
+    this loop off the request path except when a file actually changes.
+    """
+    file_stats: dict[str, list[int]] = {}
+    # Local bindings for the per-record loop: the method lookups below
+    # run once per line across the whole corpus.
+    get_stats = file_stats.get
+    loads = _json_loads
+    # Byte-level line splitting over a mapped file: no per-line str
+    # decode or strip; both JSON parsers take the raw byte slices.
+    with open(jsonl_path, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return file_stats
+        with mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                newline = mm.find(b"\n", start)
+                if newline < 0:
+                    newline = size
+                chunk = mm[start:newline]
+                start = newline + 1
+                if chunk.endswith(b"\r"):
+                    chunk = chunk[:-1]
+                if not chunk or chunk.isspace():
                     continue
                 try:
-                    record = json.loads(line)
-                except json.JSONDecodeError:
+                    record = loads(chunk)
+                except ValueError:
                     continue
 
                 agent_a = record.get("agent_a", "unknown")
                 agent_b = record.get("agent_b", "unknown")
                 winner = record.get("winner")
 
-                for agent in (agent_a, agent_b):
-                    if agent not in agent_stats:
-                        agent_stats[agent] = {
-                            "series_wins": 0,
-                            "series_losses": 0,
-                            "series_draws": 0,
-                        }
+                stats_a = get_stats(agent_a)
+                if stats_a is None:
+                    stats_a = file_stats[agent_a] = [0, 0, 0]
+                stats_b = get_stats(agent_b)
+                if stats_b is None:
+                    stats_b = file_stats[agent_b] = [0, 0, 0]
 
                 if winner == agent_a:
-                    agent_stats[agent_a]["series_wins"] += 1
-                    agent_stats[agent_b]["series_losses"] += 1
+                    stats_a[0] += 1
+                    stats_b[1] += 1
                 elif winner == agent_b:
-                    agent_stats[agent_b]["series_wins"] += 1
-                    agent_stats[agent_a]["series_losses"] += 1
+                    stats_b[0] += 1
+                    stats_a[1] += 1
+                else:
+                    stats_a[2] += 1
+                    stats_b[2] += 1
+    return file_stats
+
+
+def _load_leaderboard() -> list[dict[str, Any]]:
+    """Read all JSONL files in results/ and aggregate series wins per agent.
+
+    Two cache layers keep this cheap as the corpus grows: the final
+    entries are reused while the directory's (name, mtime_ns, size)
+    signature is unchanged, and per-file partial aggregates mean a
+    changed directory only re-parses the files that actually changed.
+    """
+    global _LB_CACHE
+    if not RESULTS_DIR.exists():
+        return []
+
+    # One scandir pass instead of glob + per-path stat: DirEntry carries
+    # the stat result from the directory read, so building the signature
+    # costs one syscall per file rather than a listing plus a stat each.
+    with os.scandir(RESULTS_DIR) as it:
+        listing = [
+            (entry.name, entry.stat())
+            for entry in it
+            if entry.name.endswith(".jsonl") and entry.is_file()
+        ]
+    listing.sort(key=lambda item: item[0])
+    paths = [RESULTS_DIR / name for name, _ in listing]
+    sig = tuple((name, st.st_mtime_ns, st.st_size) for name, st in listing)
+    cached = _LB_CACHE
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+
+    agent_stats: dict[str, list[int]] = {}
+
+    with _LB_LOCK:
+        misses = []
+        for jsonl_path, (_, mtime_ns, size) in zip(paths, sig):
+            hit = _LB_FILE_CACHE.get(jsonl_path)
+            if hit is None or hit[0] != (mtime_ns, size):
+                misses.append((jsonl_path, (mtime_ns, size)))
+        # Files are independent, so a cold or bulk-updated corpus can be
+        # parsed across the worker pool; the common steady state (zero or
+        # one changed file) stays in-process to skip the IPC round-trip.
+        if len(misses) > _LB_PARALLEL_MIN:
+            pool = _get_sim_pool()
+            aggregated = pool.map(
+                _aggregate_results_file, [path for path, _ in misses]
+            )
+            for (jsonl_path, stat_key), stats in zip(misses, aggregated):
+                _LB_FILE_CACHE[jsonl_path] = (stat_key, stats)
+        else:
+            for jsonl_path, stat_key in misses:
+                _LB_FILE_CACHE[jsonl_path] = (
+                    stat_key, _aggregate_results_file(jsonl_path),
+                )
+        for jsonl_path in paths:
+            for agent, stats in _LB_FILE_CACHE[jsonl_path][1].items():
+                merged = agent_stats.get(agent)
+                if merged is None:
+                    agent_stats[agent] = list(stats)
                 else:
-                    agent_stats[agent_a]["series_draws"] += 1
-                    agent_stats[agent_b]["series_draws"] += 1
+                    merged[0] += stats[0]
+                    merged[1] += stats[1]
+                    merged[2] += stats[2]
+        for stale in set(_LB_FILE_CACHE) - set(paths):
+            del _LB_FILE_CACHE[stale]
 
     entries = []
-    for agent, stats in sorted(agent_stats.items()):
-        total = stats["series_wins"] + stats["series_losses"] + stats["series_draws"]
-        win_rate = stats["series_wins"] / total if total > 0 else 0.0
+    for agent, (wins, losses, draws) in sorted(agent_stats.items()):
+        total = wins + losses + draws
+        win_rate = wins / total if total > 0 else 0.0
         entries.append({
             "agent": agent,
-            "series_wins": stats["series_wins"],
-            "series_losses": stats["series_losses"],
-            "series_draws": stats["series_draws"],
+            "series_wins": wins,
+            "series_losses": losses,
+            "series_draws": draws,
             "win_rate": round(win_rate, 4),
         })
 
     entries.sort(key=lambda e: e["win_rate"], reverse=True)
+    # Serialize once per corpus change: every request while the signature
+    # holds ships these exact bytes instead of re-encoding the entries.
+    with _LB_LOCK:
+        _LB_CACHE = (sig, entries, _json_dumps_bytes(entries))
     return entries
 
 
+def _leaderboard_body() -> bytes:
+    """Leaderboard as serialized JSON bytes, cached with the entries."""
+    entries = _load_leaderboard()
+    cached = _LB_CACHE
+    if cached is not None and cached[1] is entries:
+        return cached[2]
+    # RESULTS_DIR missing: _load_leaderboard returned [] without caching.
+    return _json_dumps_bytes(entries)
+
+
 def _resolve_track(track: str) -> list[Path]:
     """Resolve track parameter to list of JSONL file paths."""
     key = track.upper() if track.upper() in ("A", "B", "C") else "all"
@@ -1383,7 +1611,7 @@ def _detect_3_cycles(
     return cycles
 
 
-def _challenge_logic(build: str, games: int) -> ChallengeResponse:
+async def _challenge_logic(build: str, games: int) -> ChallengeResponse:
     try:
         animal_c, hp_c, atk_c, spd_c, wil_c = _parse_build(build)
     except ValueError as e:
@@ -1393,13 +1621,23 @@ def _challenge_logic(build: str, games: int) -> ChallengeResponse:
     total_wins = 0
     total_games = 0
 
-    for ref_build in REFERENCE_BUILDS:
-        animal_r, hp_r, atk_r, spd_r, wil_r = _parse_build(ref_build)
-        res = _run_games(
-            animal_c, hp_c, atk_c, spd_c, wil_c,
-            animal_r, hp_r, atk_r, spd_r, wil_r,
-            games, base_seed=42,
-        )
+    # The five reference runs are independent CPU-bound simulations;
+    # fan them across the process pool and collect in fixed order.
+    challenger = (animal_c, hp_c, atk_c, spd_c, wil_c)
+    keys = [(challenger, ref_build, games) for ref_build in REFERENCE_BUILDS]
+    runs = [_SIM_CACHE.get(key) for key in keys]
+    pending = [i for i, res in enumerate(runs) if res is None]
+    if pending:
+        pool = _get_sim_pool()
+        loop = asyncio.get_running_loop()
+        fetched = await asyncio.gather(*[
+            loop.run_in_executor(pool, _challenge_worker, *keys[i])
+            for i in pending
+        ])
+        for i, res in zip(pending, fetched):
+            runs[i] = res
+            _sim_cache_put(keys[i], res)
+    for ref_build, res in zip(REFERENCE_BUILDS, runs):
         wins = res["wins_a"]
         losses = res["wins_b"]
         draws = res["draws"]
@@ -1422,6 +1660,65 @@ def _challenge_logic(build: str, games: int) -> ChallengeResponse:
     )
 
 
+async def _challenge_stream(
+    challenger: tuple[str, int, int, int, int], build: str, games: int
+):
+    """NDJSON generator behind /challenge/stream.
+
+    Emits one ChallengeResult-shaped line per reference run as it
+    finishes, so the client's first byte arrives after the fastest run
+    rather than after all of them. Cached runs flush immediately, the
+    rest stream in completion order, and a final summary line carries
+    the overall win rate once every run is in.
+    """
+    keys = [(challenger, ref_build, games) for ref_build in REFERENCE_BUILDS]
+    total_wins = 0
+    total_games = 0
+
+    def _line(ref_build: str, res: dict) -> bytes:
+        wins = res["wins_a"]
+        wr = wins / games if games > 0 else 0.0
+        return _json_dumps_bytes({
+            "opponent": ref_build,
+            "wins": wins,
+            "losses": res["wins_b"],
+            "draws": res["draws"],
+            "win_rate": round(wr, 4),
+        }) + b"\n"
+
+    pending = []
+    for i, key in enumerate(keys):
+        res = _SIM_CACHE.get(key)
+        if res is None:
+            pending.append(i)
+        else:
+            total_wins += res["wins_a"]
+            total_games += games
+            yield _line(REFERENCE_BUILDS[i], res)
+
+    if pending:
+        pool = _get_sim_pool()
+        loop = asyncio.get_running_loop()
+
+        async def _run(i: int) -> tuple[int, dict]:
+            return i, await loop.run_in_executor(
+                pool, _challenge_worker, *keys[i]
+            )
+
+        for fut in asyncio.as_completed([_run(i) for i in pending]):
+            i, res = await fut
+            _sim_cache_put(keys[i], res)
+            total_wins += res["wins_a"]
+            total_games += games
+            yield _line(REFERENCE_BUILDS[i], res)
+
+    overall = total_wins / total_games if total_games > 0 else 0.0
+    yield _json_dumps_bytes({
+        "build": build,
+        "overall_win_rate": round(overall, 4),
+    }) + b"\n"
+
+
 def _inject_default_meta(html: str, request_path: str) -> str:
     if "</head>" not in html:
         return html
@@ -1561,7 +1858,29 @@ def _inject_standard_footer(html: str, request_path: str) -> str:
     return FOOTER_BLOCK_RE.sub(_render_standard_footer(), html, count=1)
 
 
+# Rendered-page cache: the page routes read a static file and inject
+# nav/footer/meta, none of which changes between requests while the file
+# on disk is unchanged. Keyed on the source file's (mtime_ns, size) so
+# edits during development still show up on the next request.
+_PAGE_LOCK = threading.Lock()
+_PAGE_CACHE: dict[tuple[str, str], tuple[tuple[int, int], str]] = {}
+
+
 def _serve_html(file_path: Path, request_path: str, html: str | None = None, status_code: int = 200) -> HTMLResponse:
+    if html is None and status_code == 200:
+        st = file_path.stat()
+        stat_key = (st.st_mtime_ns, st.st_size)
+        key = (str(file_path), request_path)
+        hit = _PAGE_CACHE.get(key)
+        if hit is not None and hit[0] == stat_key:
+            return HTMLResponse(hit[1])
+        content = file_path.read_text(encoding="utf-8")
+        content = _inject_standard_nav(content, request_path)
+        content = _inject_standard_footer(content, request_path)
+        content = _inject_default_meta(content, request_path)
+        with _PAGE_LOCK:
+            _PAGE_CACHE[key] = (stat_key, content)
+        return HTMLResponse(content)
     content = html if html is not None else file_path.read_text(encoding="utf-8")
     content = _inject_standard_nav(content, request_path)
     content = _inject_standard_footer(content, request_path)
@@ -1662,8 +1981,20 @@ def _island_not_found_html(page: str) -> str:
 # -- Page routes ----------------------------------------------------------------
 
 
+# Index render cache: the server-side rankings only change when the
+# startup precompute refreshes _cache, so the key pairs the file's stat
+# with the identity of the BT data it was rendered from.
+_INDEX_CACHE: tuple[tuple[int, int, int], bytes] | None = None
+
+
 @app.get("/")
 def index() -> HTMLResponse:
+    global _INDEX_CACHE
+    st = (STATIC_DIR / "index.html").stat()
+    render_key = (st.st_mtime_ns, st.st_size, id(_cache.get("A")))
+    cached = _INDEX_CACHE
+    if cached is not None and cached[0] == render_key:
+        return HTMLResponse(cached[1])
     html = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
     # Server-side render top-5 leaderboard rankings to avoid "Loading..." flash
     for track_key in ("A", "B", "C"):
@@ -1684,7 +2015,9 @@ def index() -> HTMLResponse:
         placeholder = f'<ul class="mini-ranking" id="track{track_key}-ranking">\n                        <li class="loading">Loading...</li>\n                    </ul>'
         replacement = f'<ul class="mini-ranking" id="track{track_key}-ranking">\n                        {rendered}\n                    </ul>'
         html = html.replace(placeholder, replacement)
-    return _serve_html(STATIC_DIR / "index.html", "/", html=html)
+    response = _serve_html(STATIC_DIR / "index.html", "/", html=html)
+    _INDEX_CACHE = (render_key, response.body)
+    return response
 
 
 @app.get("/about")
@@ -2477,8 +2810,8 @@ def pets_soul(req: dict) -> dict:
 
 
 @app.post("/fight", response_model=FightResponse)
-def fight(req: FightRequest) -> FightResponse:
-    return _fight_logic(req.build1, req.build2, req.games)
+async def fight(req: FightRequest) -> FightResponse:
+    return await _fight_logic(req.build1, req.build2, req.games)
 
 
 def _parse_s1_build(build_str: str) -> tuple[str, int, int, int, int]:
@@ -2589,8 +2922,8 @@ api_v1 = APIRouter(prefix="/api/v1")
 
 
 @api_v1.post("/fight", response_model=FightResponse)
-def api_fight(req: FightRequest) -> FightResponse:
-    return _fight_logic(req.build1, req.build2, req.games)
+async def api_fight(req: FightRequest) -> FightResponse:
+    return await _fight_logic(req.build1, req.build2, req.games)
 
 
 @api_v1.post("/fight/s1", response_model=FightResponse)
@@ -2599,13 +2932,31 @@ def api_fight_s1(req: FightRequest) -> FightResponse:
 
 
 @api_v1.get("/leaderboard")
-def api_leaderboard() -> list[dict[str, Any]]:
-    return _load_leaderboard()
+def api_leaderboard() -> Response:
+    # Raw pre-serialized body: skips per-request model validation and
+    # JSON re-encoding for a payload that only changes when results/ does.
+    return Response(
+        content=_leaderboard_body(), media_type="application/json"
+    )
 
 
 @api_v1.post("/challenge", response_model=ChallengeResponse)
-def api_challenge(req: ChallengeRequest) -> ChallengeResponse:
-    return _challenge_logic(req.build, req.games)
+async def api_challenge(req: ChallengeRequest) -> ChallengeResponse:
+    return await _challenge_logic(req.build, req.games)
+
+
+@api_v1.post("/challenge/stream")
+async def api_challenge_stream(req: ChallengeRequest) -> StreamingResponse:
+    # Build parsing happens before the response starts: a bad build must
+    # surface as a 400, not a mid-stream disconnect.
+    try:
+        challenger = _parse_build(req.build)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid build: {e}")
+    return StreamingResponse(
+        _challenge_stream(challenger, req.build, req.games),
+        media_type="application/x-ndjson",
+    )
 
 
 @api_v1.get("/leaderboard/bt")